@@ -4,32 +4,60 @@
 Инициализирует конфигурацию и запускает приложение.
 """
 
-from src.application.app import MeshtasticTelegramBotApp
-from src.config import AppConfig, setup_basic_logging
 import asyncio
 import logging
+import os
 import sys
 from pathlib import Path
 
 # Добавляем src в путь для импортов
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.config import setup_basic_logging  # noqa: E402
+
 
 # Логирование настраивается автоматически при загрузке конфигурации
 logger = logging.getLogger(__name__)
 
 
+def _should_check_env_file() -> bool:
+    """
+    Определяет, нужно ли проверять наличие .env при запуске.
+
+    MESHTASTIC_CHECK_ENV_FILE=1/0 задает поведение явно. По умолчанию
+    проверка пропускается в Docker-контейнере, где переменные приходят
+    из docker-compose, а не из файла.
+    """
+    flag = os.getenv("MESHTASTIC_CHECK_ENV_FILE")
+    if flag is not None:
+        return flag == "1"
+    return not os.path.exists("/.dockerenv")
+
+
+def _env_file_missing() -> bool:
+    """
+    Проверяет, что .env нужно искать и его нет.
+
+    Обращается к файловой системе, поэтому вызывается через asyncio.to_thread.
+    """
+    return _should_check_env_file() and not Path(".env").exists()
+
+
 async def main() -> None:
     """Главная функция приложения."""
     # Настраиваем базовое логирование для отображения ошибок
     # конфигурации
     setup_basic_logging()
 
+    # Тяжелые модули приложения (telebot, aiomqtt, meshtastic)
+    # импортируем только после настройки логирования
+    from src.application.app import MeshtasticTelegramBotApp
+    from src.config import get_config
+
     try:
         # Проверяем наличие .env файла (опционально, так как переменные могут
-        # быть в окружении)
-        env_file = Path(".env")
-        if not env_file.exists():
+        # быть в окружении). stat выполняется в потоке, не блокируя event loop
+        if await asyncio.to_thread(_env_file_missing):
             logger.warning(
                 "Файл .env не найден. "
                 "Убедитесь, что переменные окружения заданы через env_file в docker-compose.yml "
@@ -39,10 +67,10 @@ async def main() -> None:
         # Загружаем конфигурацию (сначала из YAML, затем из .env для обратной
         # совместимости)
         try:
-            config = AppConfig.load_from_yaml()
+            config = get_config()
         except ValueError as e:
             # Ошибки валидации конфигурации
-            logger.error(f"Ошибка конфигурации: {e}")
+            logger.error("Ошибка конфигурации: %s", e)
             print("\n❌ ОШИБКА КОНФИГУРАЦИИ:")
             print(str(e))
             print(
@@ -52,7 +80,7 @@ async def main() -> None:
         except Exception as e:
             error_msg = str(e)
             if "telegram" in error_msg.lower() or "bot_token" in error_msg.lower():
-                logger.error(f"Ошибка загрузки конфигурации Telegram: {error_msg}")
+                logger.error("Ошибка загрузки конфигурации Telegram: %s", error_msg)
                 print("\n❌ ОШИБКА: Не задан TELEGRAM_BOT_TOKEN")
                 print("Убедитесь, что в файле .env задана переменная:")
                 print("TELEGRAM_BOT_TOKEN=your_bot_token_here")
@@ -74,9 +102,23 @@ async def main() -> None:
         logger.info("Получен сигнал прерывания")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Критическая ошибка при запуске приложения: {e}", exc_info=True)
+        logger.error("Критическая ошибка при запуске приложения: %s", e, exc_info=True)
         sys.exit(1)
 
 
+def _install_uvloop() -> None:
+    """
+    Включает uvloop как реализацию event loop, если он установлен.
+
+    На Windows uvloop недоступен - остается стандартный asyncio loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    _install_uvloop()
     asyncio.run(main())
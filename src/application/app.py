@@ -7,7 +7,7 @@
 import asyncio
 import logging
 import signal
-from typing import Optional
+from typing import List, Optional
 
 from src.config import AppConfig
 from src.service.topic_routing_service import RoutingMode
@@ -16,12 +16,21 @@ from src.handlers.handler_factory import HandlerChainFactory
 from src.handlers.message_handler_adapter import MessageHandlerAdapter
 from src.handlers.proxy_status_handler import ProxyStatusHandler
 from src.handlers.telegram_commands import TelegramCommandsHandler
+from src.application.startup import InitializationTask, execute_optimized_startup
 from src.infrastructure.di_setup import setup_container
 from src.infrastructure.di_container import DIContainer
 
 
 logger = logging.getLogger(__name__)
 
+# Таймаут подключения к брокеру при запуске (в секундах)
+_STARTUP_CONNECT_TIMEOUT = 30.0
+
+# Сигналы остановки, доступные на текущей платформе (на Windows нет SIGTERM)
+_SHUTDOWN_SIGNALS = tuple(
+    sig for sig in (getattr(signal, "SIGTERM", None), signal.SIGINT) if sig is not None
+)
+
 
 class MeshtasticTelegramBotApp:
     """Главный класс приложения - запускает и останавливает все сервисы."""
@@ -36,7 +45,12 @@ class MeshtasticTelegramBotApp:
         """
         self.config = config
         self._running = False
+        # True, пока start() работает и сам выполнит остановку в finally
+        self._serving = False
         self._shutdown_event: Optional[asyncio.Event] = None
+        self._shutdown_task: Optional[asyncio.Task] = None
+        self._subscribe_task: Optional[asyncio.Task] = None
+        self._telegram_polling_task: Optional[asyncio.Task] = None
 
         # Настраиваем DI-контейнер
         if container is None:
@@ -52,23 +66,102 @@ class MeshtasticTelegramBotApp:
         self.grouping_service = container.resolve("message_grouping_service")
         self.topic_routing_service = container.resolve("topic_routing_service")
 
+        # Цепочка обработчиков собирается в start() внутри запущенного loop
+        self.mqtt_handler: Optional[MessageHandlerAdapter] = None
+
+        # Создаем обработчик статуса прокси (отдельно от основного брокера)
+        proxy_status_handler = ProxyStatusHandler(self.proxy_service)
+
+        # Создаем обработчик команд Telegram
+        self.telegram_commands_handler = TelegramCommandsHandler(
+            bot=self.telegram_repo.bot,
+            telegram_repo=self.telegram_repo,
+            proxy_status_handler=proxy_status_handler,
+        )
+
+    async def start(self) -> None:
+        """Запускает все сервисы и начинает обработку сообщений."""
+        logger.info("Запуск Meshtastic Telegram Bot")
+
+        self._shutdown_event = asyncio.Event()
+        self._running = True
+
+        # Настраиваем обработку сигналов для корректного завершения
+        try:
+            loop = asyncio.get_running_loop()
+            for sig in _SHUTDOWN_SIGNALS:
+                loop.add_signal_handler(sig, self._on_signal, sig)
+        except (NotImplementedError, ValueError):
+            # На Windows может не работать
+            logger.warning(
+                "Не удалось установить обработчики сигналов (возможно, Windows)"
+            )
+
+        self._serving = True
+        try:
+            await self._build_handlers()
+
+            # Подключения к прокси, основному брокеру и Telegram независимы -
+            # запускаем их параллельно через граф задач запуска
+            await execute_optimized_startup(self._build_startup_tasks())
+
+            logger.info("Приложение запущено и готово к работе")
+
+            # Подписка на MQTT и polling Telegram работают под TaskGroup:
+            # падение одной задачи сразу отменяет другую и пробрасывает ошибку
+            shutdown_event = self._shutdown_event
+            async with asyncio.TaskGroup() as tg:
+                subscribe_task = tg.create_task(
+                    self.main_broker_service.subscribe(self.mqtt_handler)
+                )
+                polling_task = tg.create_task(
+                    self.telegram_commands_handler.start_polling()
+                )
+                self._subscribe_task = subscribe_task
+                self._telegram_polling_task = polling_task
+
+                # Ждем сигнала остановки. Локальные ссылки нужны, так как
+                # stop() сбрасывает атрибуты в None
+                await shutdown_event.wait()
+                subscribe_task.cancel()
+                polling_task.cancel()
+
+        except Exception as e:
+            logger.error(
+                "Критическая ошибка при запуске приложения: %s", e, exc_info=True
+            )
+            raise
+        finally:
+            # TaskGroup к этому моменту уже отменил подписку и polling -
+            # теперь можно закрывать клиенты
+            self._serving = False
+            await self._teardown()
+
+    async def _build_handlers(self) -> None:
+        """
+        Собирает стратегию и цепочку обработчиков MQTT сообщений.
+
+        Вызывается из start(), чтобы ресурсы обработчиков создавались уже
+        в работающем event loop.
+        """
         # Создаем стратегию обработки по умолчанию
         default_processing_mode = ProcessingMode.GROUP
-        if config.message_processing.default_mode == "private":
+        if self.config.message_processing.default_mode == "private":
             default_processing_mode = ProcessingMode.PRIVATE
-        elif config.message_processing.default_mode == "all":
+        elif self.config.message_processing.default_mode == "all":
             default_processing_mode = ProcessingMode.ALL
 
         default_strategy = HandlerChainFactory.create_strategy(
             mode=default_processing_mode,
-            send_to_users=config.message_processing.group_mode_send_to_users,
+            send_to_users=self.config.message_processing.group_mode_send_to_users,
             node_cache_service=self.node_cache_service,
             grouping_service=self.grouping_service,
-            telegram_config=config.telegram,
+            telegram_config=self.config.telegram,
         )
 
         # Создаем зависимости для обработчиков
-        notify_user_ids = config.telegram.allowed_user_ids
+        # frozenset - один раз при запуске, чтобы не пересобирать на каждое сообщение
+        notify_user_ids = frozenset(self.config.telegram.allowed_user_ids or ())
         handler_dependencies = {
             "proxy": {"proxy_service": self.proxy_service},
             "telegram": {
@@ -81,7 +174,7 @@ class MeshtasticTelegramBotApp:
 
         # Создаем цепочку обработчиков через фабрику
         handler_chain = HandlerChainFactory.create_chain(
-            handlers_config=config.message_processing.handlers,
+            handlers_config=self.config.message_processing.handlers,
             dependencies=handler_dependencies,
             topic_routing_service=self.topic_routing_service,
         )
@@ -89,108 +182,115 @@ class MeshtasticTelegramBotApp:
         # Обертываем в адаптер для совместимости с существующим интерфейсом
         self.mqtt_handler = MessageHandlerAdapter(handler_chain)
 
-        # Создаем обработчик статуса прокси (отдельно от основного брокера)
-        proxy_status_handler = ProxyStatusHandler(self.proxy_service)
-
-        # Создаем обработчик команд Telegram
-        self.telegram_commands_handler = TelegramCommandsHandler(
-            bot=self.telegram_repo.bot,
-            telegram_repo=self.telegram_repo,
-            proxy_status_handler=proxy_status_handler,
-        )
-
-    async def start(self) -> None:
-        """Запускает все сервисы и начинает обработку сообщений."""
-        logger.info("Запуск Meshtastic Telegram Bot")
+    def _build_startup_tasks(self) -> List[InitializationTask]:
+        """
+        Описывает задачи запуска сервисов и зависимости между ними.
 
-        self._shutdown_event = asyncio.Event()
-        self._running = True
-        self._subscribe_task: Optional[asyncio.Task] = None
-        self._telegram_polling_task: Optional[asyncio.Task] = None
+        Returns:
+            Список задач для execute_optimized_startup
+        """
+        return [
+            InitializationTask(
+                name="proxy_start",
+                coro_factory=self.proxy_service.start,
+                # Без таймаута: прокси-цели необязательны, MQTTProxyService.start
+                # сам гасит ошибки подключения отдельных целей
+                timeout=None,
+            ),
+            InitializationTask(
+                name="broker_start",
+                coro_factory=self.main_broker_service.start,
+                timeout=_STARTUP_CONNECT_TIMEOUT,
+            ),
+            InitializationTask(
+                name="telegram_connect",
+                coro_factory=self._warm_up_telegram,
+            ),
+        ]
+
+    async def _warm_up_telegram(self) -> None:
+        """
+        Прогревает подключение к Telegram, не блокируя запуск.
 
-        # Настраиваем обработку сигналов для корректного завершения
-        # На Windows SIGTERM может не работать
+        Недоступность Telegram API при старте не должна останавливать бота
+        и MQTT-прокси: polling сам переподключается позже.
+        """
         try:
-            loop = asyncio.get_event_loop()
-            if hasattr(signal, "SIGTERM"):
-                loop.add_signal_handler(
-                    signal.SIGTERM,
-                    lambda: asyncio.create_task(self._handle_shutdown(signal.SIGTERM)),
-                )
-            loop.add_signal_handler(
-                signal.SIGINT,
-                lambda: asyncio.create_task(self._handle_shutdown(signal.SIGINT)),
+            await asyncio.wait_for(
+                self.telegram_repo.connect(), _STARTUP_CONNECT_TIMEOUT
             )
-        except (NotImplementedError, ValueError):
-            # На Windows может не работать
+        except Exception as e:
             logger.warning(
-                "Не удалось установить обработчики сигналов (возможно, Windows)"
+                "Не удалось прогреть подключение к Telegram при запуске: %r. "
+                "Продолжаем запуск, polling переподключится",
+                e,
             )
 
-        try:
-            # Запускаем прокси и основной брокер
-            await self.proxy_service.start()
-            await self.main_broker_service.start()
-
-            logger.info("Приложение запущено и готово к работе")
+    async def stop(self) -> None:
+        """
+        Останавливает приложение.
 
-            # Подписка на MQTT - блокирующая операция, запускаем в отдельной
-            # задаче
-            self._subscribe_task = asyncio.create_task(
-                self.main_broker_service.subscribe(self.mqtt_handler)
-            )
+        Если работает start(), только будит его событием остановки: start()
+        сначала отменяет подписку и polling, а затем сам закрывает клиенты.
+        Иначе отключается от брокеров и Telegram напрямую.
+        """
+        if not self._running:
+            return
 
-            # Polling для Telegram команд тоже в отдельной задаче
-            self._telegram_polling_task = asyncio.create_task(
-                self.telegram_commands_handler.start_polling()
-            )
+        if self._serving and self._shutdown_event:
+            self._shutdown_event.set()
+            return
 
-            # Ждем сигнала остановки
-            await self._shutdown_event.wait()
+        await self._teardown()
 
-        except Exception as e:
-            logger.error(
-                f"Критическая ошибка при запуске приложения: {e}", exc_info=True
-            )
-            raise
-        finally:
-            await self.stop()
+    async def _teardown(self) -> None:
+        """
+        Отключается от брокеров и закрывает сессию Telegram.
 
-    async def stop(self) -> None:
-        """Останавливает все сервисы и задачи."""
+        Вызывается, когда фоновые задачи уже не работают.
+        """
         if not self._running:
             return
 
         logger.info("Остановка Meshtastic Telegram Bot")
         self._running = False
 
-        # Отменяем задачи
-        if self._subscribe_task and not self._subscribe_task.done():
-            self._subscribe_task.cancel()
-            try:
-                await self._subscribe_task
-            except asyncio.CancelledError:
-                pass
-
-        if self._telegram_polling_task and not self._telegram_polling_task.done():
-            self._telegram_polling_task.cancel()
-            try:
-                await self._telegram_polling_task
-            except asyncio.CancelledError:
-                pass
-
-        try:
-            # Отключаемся от брокеров
-            await self.main_broker_service.stop()
-            await self.proxy_service.stop()
-
+        # Отключаемся от брокеров и Telegram параллельно: ошибка одного
+        # не мешает остановке остальных
+        results = await asyncio.gather(
+            self.main_broker_service.stop(),
+            self.proxy_service.stop(),
+            self.telegram_repo.disconnect(),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        for error in errors:
+            logger.error("Ошибка при остановке приложения: %s", error, exc_info=error)
+        if not errors:
             logger.info("Приложение остановлено")
-        except Exception as e:
-            logger.error(f"Ошибка при остановке приложения: {e}", exc_info=True)
 
         if self._shutdown_event:
             self._shutdown_event.set()
 
+        # Сбрасываем состояние, чтобы повторный start() создал свежее событие
+        # и не завершился сразу по уже установленному
+        self._shutdown_event = None
+        self._subscribe_task = None
+        self._telegram_polling_task = None
+
+    def _on_signal(self, sig: signal.Signals | int) -> None:
+        """
+        Callback обработчика сигнала: планирует остановку приложения.
+
+        Ссылка на задачу сохраняется, чтобы она не была собрана GC до завершения.
+
+        Args:
+            sig: Полученный сигнал
+        """
+        self._shutdown_task = asyncio.get_running_loop().create_task(
+            self._handle_shutdown(sig)
+        )
+
     async def _handle_shutdown(self, sig: signal.Signals | int) -> None:
         """
         Вызывается при получении сигнала остановки (SIGTERM/SIGINT).
@@ -199,15 +299,18 @@ class MeshtasticTelegramBotApp:
             sig: Сигнал остановки
         """
         sig_name = sig.name if hasattr(sig, "name") else str(sig)
-        logger.info(f"Получен сигнал остановки: {sig_name}")
-        await self.stop()
+        logger.info("Получен сигнал остановки: %s", sig_name)
+        # Будим start(): он отменит задачи и сам вызовет stop()
+        if self._shutdown_event:
+            self._shutdown_event.set()
 
     async def run_forever(self) -> None:
-        """Запускает приложение и работает до остановки."""
+        """
+        Запускает приложение и работает до остановки.
+
+        start() сам ждет события остановки и вызывает stop() перед выходом.
+        """
         try:
             await self.start()
         except KeyboardInterrupt:
             logger.info("Получен KeyboardInterrupt")
-        finally:
-            if self._shutdown_event:
-                await self._shutdown_event.wait()
@@ -0,0 +1,104 @@
+"""
+Параллельный запуск компонентов приложения с учетом зависимостей.
+
+Задачи запуска описываются с таймаутом и зависимостями.
+Независимые задачи одного уровня выполняются одновременно.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InitializationTask:
+    """Описание одной задачи запуска."""
+
+    name: str
+    coro_factory: Callable[[], Awaitable[Any]]
+    timeout: Optional[float] = None  # Таймаут в секундах (None = без ограничения)
+    dependencies: Tuple[str, ...] = ()
+
+
+def _build_levels(
+    tasks: Sequence[InitializationTask],
+) -> List[List[InitializationTask]]:
+    """
+    Разбивает задачи на уровни топологической сортировкой.
+
+    Задачи одного уровня не зависят друг от друга.
+
+    Args:
+        tasks: Задачи запуска
+
+    Returns:
+        Список уровней в порядке выполнения
+
+    Raises:
+        ValueError: Если есть дубликаты, неизвестные зависимости или цикл
+    """
+    by_name: Dict[str, InitializationTask] = {}
+    for task in tasks:
+        if task.name in by_name:
+            raise ValueError(f"Дублирующаяся задача запуска: {task.name}")
+        by_name[task.name] = task
+
+    for task in tasks:
+        for dependency in task.dependencies:
+            if dependency not in by_name:
+                raise ValueError(
+                    f"Неизвестная зависимость {dependency} у задачи {task.name}"
+                )
+
+    levels: List[List[InitializationTask]] = []
+    done: set = set()
+    pending = list(tasks)
+    while pending:
+        ready = [t for t in pending if all(d in done for d in t.dependencies)]
+        if not ready:
+            names = ", ".join(t.name for t in pending)
+            raise ValueError(f"Циклическая зависимость между задачами: {names}")
+        levels.append(ready)
+        done.update(t.name for t in ready)
+        pending = [t for t in pending if t.name not in done]
+
+    return levels
+
+
+async def execute_optimized_startup(
+    tasks: Sequence[InitializationTask], concurrency: int = 4
+) -> None:
+    """
+    Выполняет задачи запуска уровень за уровнем.
+
+    Задачи одного уровня запускаются параллельно (не более concurrency
+    одновременно). Следующий уровень стартует только после успешного
+    завершения предыдущего.
+
+    Args:
+        tasks: Задачи запуска
+        concurrency: Максимум одновременно выполняемых задач
+
+    Raises:
+        Exception: Первая ошибка из упавшего уровня (в т.ч. asyncio.TimeoutError)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(task: InitializationTask) -> None:
+        async with semaphore:
+            logger.debug("Запуск задачи инициализации: %s", task.name)
+            await asyncio.wait_for(task.coro_factory(), task.timeout)
+
+    for level in _build_levels(tasks):
+        results = await asyncio.gather(
+            *(run(task) for task in level), return_exceptions=True
+        )
+        for task, result in zip(level, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Ошибка задачи инициализации %s: %r", task.name, result
+                )
+                raise result
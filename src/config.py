@@ -6,39 +6,70 @@
 Использует Pydantic для валидации.
 """
 import os
+import re
 import sys
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from typing import Collection, List, Optional, Dict, Any, Tuple
 from dotenv import load_dotenv
-from pydantic import Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
-import importlib
 
-yaml = None
-YAML_AVAILABLE = False
-try:
-    yaml = importlib.import_module("yaml")  # type: ignore
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+# .env загружается один раз при первом создании AppConfig, а не при импорте
+_dotenv_loaded = False
 
-if TYPE_CHECKING:
-    from typing import Any as _yaml  # noqa: F401
 
-# Загружаем переменные окружения из .env
-load_dotenv()
+def _ensure_dotenv_loaded() -> None:
+    """Загружает переменные окружения из .env при первом вызове."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+# Уровень и формат, с которыми уже настроено логирование (None - еще не настроено)
+_logging_configured: Optional[Tuple[int, str]] = None
+
+# Формат логов по умолчанию и таблица уровней - строятся один раз при импорте
+_DEFAULT_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+_LOG_LEVELS: Dict[str, int] = logging.getLevelNamesMapping()
 
 
 def setup_logging(
     level: Optional[str] = None, format_string: Optional[str] = None
 ) -> None:
-    """Настраивает логирование (уровень из LOG_LEVEL или INFO по умолчанию)."""
-    log_level = level or os.getenv("LOG_LEVEL", "INFO").upper()
-    log_format = format_string or "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+    """
+    Настраивает логирование (уровень из LOG_LEVEL или INFO по умолчанию).
+
+    Повторный вызов с теми же уровнем и форматом ничего не делает,
+    смена только уровня не пересоздает обработчики.
+    """
+    global _logging_configured
+
+    log_level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    log_format = format_string or _DEFAULT_LOG_FORMAT
 
     # Преобразуем строку уровня в константу logging
-    numeric_level = getattr(logging, log_level, logging.INFO)
+    numeric_level = _LOG_LEVELS.get(log_level, logging.INFO)
+
+    if _logging_configured == (numeric_level, log_format):
+        return
+    if _logging_configured is not None and _logging_configured[1] == log_format:
+        # Меняется только уровень - обработчики не пересоздаем
+        logging.getLogger().setLevel(numeric_level)
+        _logging_configured = (numeric_level, log_format)
+        return
+    _logging_configured = (numeric_level, log_format)
 
     logging.basicConfig(
         level=numeric_level,
@@ -52,13 +83,160 @@ def setup_logging(
 
 def setup_basic_logging() -> None:
     """Базовое логирование для отображения ошибок до загрузки полной конфигурации."""
+    if _logging_configured is not None:
+        # Полное логирование уже настроено - не откатываем его к базовому
+        return
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 
+# Разделитель списка user_id: запятая с любыми пробелами вокруг
+_USER_ID_SEPARATOR = re.compile(r"\s*,\s*")
+
+# YAML файл конфигурации по умолчанию (в корне проекта)
+_DEFAULT_YAML_PATH = Path("mqtt_config.yaml")
+
+
+def _env_override_keys(*prefixes: str) -> Dict[str, frozenset]:
+    """
+    Собирает имена полей, заданных непустыми переменными окружения.
+
+    Окружение просматривается один раз для всех префиксов.
+
+    Args:
+        prefixes: Префиксы переменных (например, "MQTT_SOURCE_")
+
+    Returns:
+        Префикс -> имена полей в нижнем регистре без префикса
+    """
+    buckets: Dict[str, set] = {prefix: set() for prefix in prefixes}
+    for key, value in os.environ.items():
+        if value and key.startswith(prefixes):
+            for prefix in prefixes:
+                if key.startswith(prefix):
+                    buckets[prefix].add(key[len(prefix):].lower())
+                    break
+    return {prefix: frozenset(keys) for prefix, keys in buckets.items()}
+
+
+def _yaml_overrides(
+    model_cls: type, data: Dict[str, Any], env_overrides: frozenset
+) -> Dict[str, Any]:
+    """
+    Отбирает значения секции YAML для обновления вложенной конфигурации.
+
+    Переменные окружения имеют приоритет: поля, заданные в окружении,
+    из YAML не берутся.
+
+    Args:
+        model_cls: Класс конфигурации секции
+        data: Данные секции из YAML
+        env_overrides: Поля секции, заданные в окружении
+
+    Returns:
+        Словарь обновлений для model_copy
+    """
+    return {
+        key: value
+        for key, value in data.items()
+        if key in model_cls.model_fields and key.lower() not in env_overrides
+    }
+
+
+def clear_config_cache() -> None:
+    """Сбрасывает кэш get_config и прокси-цели из окружения (например, в тестах)."""
+    _proxy_target_from_env.cache_clear()
+    get_config.cache_clear()
+
+
+# Допустимые значения строковых параметров (собираются один раз при импорте)
+_PAYLOAD_FORMATS = frozenset({"json", "protobuf", "both"})
+_PROCESSING_MODES = frozenset({"private", "group", "all"})
+
+# Строковые значения, которые считаются отсутствием значения
+_NULLISH_VALUES = frozenset({"", "none", "None", "NONE", "null", "Null", "NULL"})
+
+
+def _is_nullish(v: str) -> bool:
+    """
+    Проверяет, означает ли строка отсутствие значения.
+
+    Частые варианты написания проверяются по множеству без lower(),
+    числовые строки до lower() не доходят.
+
+    Args:
+        v: Строка без пробелов по краям
+
+    Returns:
+        True для пустой строки, "none" и "null" в любом регистре
+    """
+    if v in _NULLISH_VALUES:
+        return True
+    return v[0].isalpha() and v.lower() in _NULLISH_VALUES
+
+
+def _parse_optional_int(v: str | int | None, field_name: str) -> int | None:
+    """
+    Парсит необязательное целое из строки или числа.
+
+    Обрабатывает пустые строки, "none" и "null" как None.
+
+    Args:
+        v: Значение из переменной окружения или конфигурации
+        field_name: Имя поля (для сообщения об ошибке)
+
+    Returns:
+        Целое число или None
+    """
+    if v is None:
+        return None
+
+    if isinstance(v, int):
+        return v
+
+    if isinstance(v, str):
+        v = v.strip()
+        if _is_nullish(v):
+            return None
+
+        try:
+            return int(v)
+        except ValueError:
+            raise ValueError(f"Некорректный формат {field_name}: {v}")
+
+    return None
+
+
+@lru_cache(maxsize=64)
+def _parse_user_ids(v: str) -> Optional[frozenset[int]]:
+    """
+    Парсит список user_id из строки вида "123, 456 789".
+
+    Результат неизменяем, поэтому кэшируется по исходной строке.
+
+    Args:
+        v: Строка из переменной окружения или конфигурации
+
+    Returns:
+        Множество user_id или None для пустых значений
+
+    Raises:
+        ValueError: Если среди значений есть не числа
+    """
+    # Пробелы вокруг разделителей съедает регулярное выражение
+    v = v.strip()
+    if _is_nullish(v):
+        return None
+
+    try:
+        return frozenset(map(int, filter(None, _USER_ID_SEPARATOR.split(v))))
+    except ValueError:
+        raise ValueError(f"Некорректный формат allowed_user_ids: {v}")
+
+
 class MQTTBrokerConfig(BaseSettings):
     """Конфигурация MQTT брокера (источник данных)."""
 
-    model_config = SettingsConfigDict(env_prefix="MQTT_SOURCE_")
+    model_config = SettingsConfigDict(env_prefix="MQTT_SOURCE_", frozen=True)
 
     host: str = Field(default="localhost", description="Хост MQTT брокера")
     port: int = Field(default=1883, description="Порт MQTT брокера")
@@ -69,35 +247,34 @@ class MQTTBrokerConfig(BaseSettings):
         default="meshtastic-telegram-bot", description="MQTT client ID"
     )
     keepalive: int = Field(default=60, description="Keepalive интервал в секундах")
-    qos: int = Field(default=1, description="QoS уровень подписки")
+    qos: int = Field(
+        default=1, ge=0, le=2, description="QoS уровень подписки (0, 1 или 2)"
+    )
     payload_format: str = Field(
         default="json",
         description="Формат сообщений Meshtastic: json | protobuf | both",
     )
 
-    @field_validator("qos")
-    @classmethod
-    def validate_qos(cls, v: int) -> int:
-        """Валидация QoS: должен быть 0, 1 или 2."""
-        if v not in (0, 1, 2):
-            raise ValueError("QoS должен быть 0, 1 или 2")
-        return v
-
     @field_validator("payload_format")
     @classmethod
     def validate_payload_format(cls, v: str) -> str:
         """Валидация формата payload."""
-        allowed = {"json", "protobuf", "both"}
         value = v.lower().strip()
-        if value not in allowed:
-            raise ValueError(f"payload_format должен быть одним из {allowed}")
+        if value not in _PAYLOAD_FORMATS:
+            raise ValueError("payload_format должен быть одним из: json, protobuf, both")
         return value
 
 
-class MQTTProxyTargetConfig(BaseSettings):
-    """Конфигурация целевого MQTT сервера для прокси."""
+class MQTTProxyTargetConfig(BaseModel):
+    """
+    Конфигурация целевого MQTT сервера для прокси.
 
-    model_config = SettingsConfigDict(env_prefix="MQTT_PROXY_TARGET_")
+    Обычная модель без источников pydantic-settings: цели из YAML не читают
+    окружение. Цель из переменных MQTT_PROXY_TARGET_* создает
+    _MQTTProxyTargetEnvConfig.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     name: str = Field(description="Имя прокси-цели (для логирования)")
     host: str = Field(description="Хост целевого MQTT брокера")
@@ -111,7 +288,9 @@ class MQTTProxyTargetConfig(BaseSettings):
         default=None, description="MQTT client ID (опционально)"
     )
     enabled: bool = Field(default=True, description="Включен ли этот прокси")
-    qos: int = Field(default=1, description="QoS уровень публикации")
+    qos: int = Field(
+        default=1, ge=0, le=2, description="QoS уровень публикации (0, 1 или 2)"
+    )
     tls: bool = Field(
         default=False, description="Использовать TLS/SSL соединение (для порта 8883)"
     )
@@ -120,29 +299,99 @@ class MQTTProxyTargetConfig(BaseSettings):
         description="Отключить проверку сертификата (только для самоподписанных сертификатов)",
     )
 
-    @field_validator("qos")
-    @classmethod
-    def validate_qos(cls, v: int) -> int:
-        """Валидация QoS: должен быть 0, 1 или 2."""
-        if v not in (0, 1, 2):
-            raise ValueError("QoS должен быть 0, 1 или 2")
-        return v
+
+class _MQTTProxyTargetEnvConfig(MQTTProxyTargetConfig, BaseSettings):
+    """Прокси-цель, загружаемая из переменных окружения MQTT_PROXY_TARGET_*."""
+
+    model_config = SettingsConfigDict(env_prefix="MQTT_PROXY_TARGET_", frozen=True)
+
+
+# Валидатор списка прокси-целей: весь список проверяется одним вызовом pydantic-core
+_PROXY_TARGETS_ADAPTER = TypeAdapter(List[MQTTProxyTargetConfig])
+
+
+def _validate_proxy_targets(data: List[Any]) -> List[MQTTProxyTargetConfig]:
+    """
+    Валидирует список прокси-целей из YAML.
+
+    Некорректные цели пропускаются с предупреждением, остальные загружаются.
+
+    Args:
+        data: Список описаний прокси-целей
+
+    Returns:
+        Список валидных конфигураций прокси-целей
+    """
+    try:
+        return _PROXY_TARGETS_ADAPTER.validate_python(data)
+    except ValidationError as e:
+        logging.warning(f"Ошибка при загрузке прокси-цели из YAML: {e}")
+        invalid = {error["loc"][0] for error in e.errors() if error["loc"]}
+        valid = [item for index, item in enumerate(data) if index not in invalid]
+        return _PROXY_TARGETS_ADAPTER.validate_python(valid)
+
+
+def _env_proxy_target() -> Optional[MQTTProxyTargetConfig]:
+    """
+    Загружает прокси-цель из переменных MQTT_PROXY_TARGET_*, если они есть.
+
+    Returns:
+        Включенная прокси-цель с хостом или None
+    """
+    env = tuple(
+        sorted(
+            (key, value)
+            for key, value in os.environ.items()
+            if key.startswith("MQTT_PROXY_TARGET_")
+        )
+    )
+    if not env:
+        return None
+    return _proxy_target_from_env(env)
+
+
+@lru_cache(maxsize=1)
+def _proxy_target_from_env(
+    env: Tuple[Tuple[str, str], ...]
+) -> Optional[MQTTProxyTargetConfig]:
+    """
+    Создает прокси-цель из окружения, кэшируя ее по значениям переменных.
+
+    Модель неизменяема, поэтому один экземпляр можно отдавать повторно.
+
+    Args:
+        env: Отсортированные пары (имя, значение) переменных MQTT_PROXY_TARGET_*
+
+    Returns:
+        Включенная прокси-цель с хостом или None
+    """
+    try:
+        target_config = _MQTTProxyTargetEnvConfig()
+    except Exception:
+        # Если не удалось загрузить, прокси-цели из окружения нет
+        return None
+    if target_config.enabled and target_config.host:
+        return target_config
+    return None
 
 
 class TelegramConfig(BaseSettings):
     """Конфигурация Telegram бота."""
 
-    model_config = SettingsConfigDict(env_prefix="TELEGRAM_")
+    model_config = SettingsConfigDict(env_prefix="TELEGRAM_", frozen=True)
 
     bot_token: str = Field(description="Токен Telegram бота")
     group_chat_id: Optional[int] = Field(default=None, description="ID группового чата")
     group_topic_id: Optional[int] = Field(
         default=None,
-        description="ID темы в группе (message_thread_id). Используется для форумов. Если не указан - отправляется в общий чат.",
+        description=(
+            "ID темы в группе (message_thread_id). Используется для форумов. "
+            "Если не указан - отправляется в общий чат."
+        ),
     )
-    allowed_user_ids: Optional[List[int]] = Field(
+    allowed_user_ids: Optional[frozenset[int]] = Field(
         default=None,
-        description="Список разрешенных user_id для личных сообщений (None = все)",
+        description="Множество разрешенных user_id для личных сообщений (None = все)",
     )
     show_receive_time: bool = Field(
         default=False,
@@ -157,100 +406,54 @@ class TelegramConfig(BaseSettings):
         description="Таймаут группировки сообщений в секундах (после этого времени новые ноды не добавляются)",
     )
 
-    @field_validator("group_chat_id", mode="before")
+    @field_validator("group_chat_id", "group_topic_id", mode="before")
     @classmethod
-    def parse_group_chat_id(cls, v: str | int | None) -> int | None:
+    def parse_optional_ids(
+        cls, v: str | int | None, info: ValidationInfo
+    ) -> int | None:
         """
-        Парсит group_chat_id из строки или числа.
+        Парсит group_chat_id и group_topic_id из строки или числа.
 
         Обрабатывает пустые строки как None.
 
         Args:
             v: Значение из переменной окружения или конфигурации
+            info: Контекст валидации (имя поля)
 
         Returns:
             Целое число или None
         """
-        if v is None:
-            return None
+        return _parse_optional_int(v, info.field_name)
 
-        if isinstance(v, int):
-            return v
-
-        if isinstance(v, str):
-            v = v.strip()
-            if not v or v.lower() in ("none", "null", ""):
-                return None
-
-            try:
-                return int(v)
-            except ValueError:
-                raise ValueError(f"Некорректный формат group_chat_id: {v}")
-
-        return None
-
-    @field_validator("group_topic_id", mode="before")
+    @field_validator("allowed_user_ids", mode="before")
     @classmethod
-    def parse_group_topic_id(cls, v: str | int | None) -> int | None:
+    def parse_allowed_user_ids(
+        cls, v: str | int | Collection[int] | None
+    ) -> Collection[int] | None:
         """
-        Парсит group_topic_id из строки или числа.
+        Парсит разрешенные user_id из строки, числа или коллекции.
 
-        Обрабатывает пустые строки как None.
+        Поддерживает формат: "123,456,789" или [123, 456, 789]. Результат
+        хранится как frozenset для проверки доступа за O(1).
 
         Args:
             v: Значение из переменной окружения или конфигурации
 
         Returns:
-            Целое число или None
+            Коллекция целых чисел или None
         """
         if v is None:
             return None
 
+        # Один id из окружения pydantic-settings декодирует как JSON-число
         if isinstance(v, int):
-            return v
-
-        if isinstance(v, str):
-            v = v.strip()
-            if not v or v.lower() in ("none", "null", ""):
-                return None
-
-            try:
-                return int(v)
-            except ValueError:
-                raise ValueError(f"Некорректный формат group_topic_id: {v}")
-
-        return None
-
-    @field_validator("allowed_user_ids", mode="before")
-    @classmethod
-    def parse_allowed_user_ids(cls, v: str | List[int] | None) -> List[int] | None:
-        """
-        Парсит список разрешенных user_id из строки или списка.
+            return frozenset((v,))
 
-        Поддерживает формат: "123,456,789" или [123, 456, 789]
-
-        Args:
-            v: Значение из переменной окружения или конфигурации
-
-        Returns:
-            Список целых чисел или None
-        """
-        if v is None:
-            return None
-
-        if isinstance(v, list):
+        if isinstance(v, (list, tuple, set, frozenset)):
             return v
 
         if isinstance(v, str):
-            # Удаляем пробелы и разбиваем по запятым
-            v = v.strip()
-            if not v:
-                return None
-
-            try:
-                return [int(uid.strip()) for uid in v.split(",") if uid.strip()]
-            except ValueError:
-                raise ValueError(f"Некорректный формат allowed_user_ids: {v}")
+            return _parse_user_ids(v)
 
         return None
 
@@ -258,7 +461,7 @@ class TelegramConfig(BaseSettings):
 class MessageProcessingConfig(BaseSettings):
     """Конфигурация обработки сообщений."""
 
-    model_config = SettingsConfigDict(env_prefix="MESSAGE_PROCESSING_")
+    model_config = SettingsConfigDict(env_prefix="MESSAGE_PROCESSING_", frozen=True)
 
     # Режим обработки по умолчанию (используется если не определен из топика)
     default_mode: str = Field(
@@ -285,10 +488,9 @@ class MessageProcessingConfig(BaseSettings):
     @classmethod
     def validate_default_mode(cls, v: str) -> str:
         """Валидация режима обработки."""
-        allowed = {"private", "group", "all"}
         value = v.lower().strip()
-        if value not in allowed:
-            raise ValueError(f"default_mode должен быть одним из {allowed}")
+        if value not in _PROCESSING_MODES:
+            raise ValueError("default_mode должен быть одним из: private, group, all")
         return value
 
 
@@ -301,6 +503,7 @@ class AppConfig(BaseSettings):
         case_sensitive=False,
         extra="ignore",
         env_nested_delimiter="__",  # Для вложенных конфигураций
+        frozen=True,  # Конфигурация неизменяема, изменения - через model_copy
     )
 
     # MQTT источник
@@ -327,6 +530,29 @@ class AppConfig(BaseSettings):
     log_level: str = Field(default="INFO", description="Уровень логирования")
     log_format: str = Field(default="json", description="Формат логов: json или text")
 
+    @classmethod
+    def with_env_proxies(cls) -> "AppConfig":
+        """
+        Создает конфигурацию и добавляет прокси-цель из окружения.
+
+        Поддерживает загрузку одной цели с префиксом MQTT_PROXY_TARGET_
+        (для обратной совместимости). Для множественных целей используйте
+        YAML файл. Сканирование окружения вынесено из валидации, чтобы
+        обычное создание AppConfig его не выполняло.
+
+        Returns:
+            Экземпляр AppConfig
+        """
+        config = cls()
+        # Если уже есть цели, не перезаписываем
+        if config.mqtt_proxy_targets:
+            return config
+
+        target_config = _env_proxy_target()
+        if target_config is None:
+            return config
+        return config.model_copy(update={"mqtt_proxy_targets": [target_config]})
+
     @classmethod
     def load_from_yaml(cls, yaml_path: Optional[str] = None) -> "AppConfig":
         """
@@ -334,6 +560,8 @@ class AppConfig(BaseSettings):
 
         Если YAML файл не найден или не содержит нужных настроек,
         используются значения из переменных окружения (.env).
+        Каждый вызов загружает конфигурацию заново; один экземпляр
+        на процесс возвращает get_config().
 
         Args:
             yaml_path: Путь к YAML файлу. По умолчанию ищет 'mqtt_config.yaml' в корне проекта.
@@ -341,69 +569,75 @@ class AppConfig(BaseSettings):
         Returns:
             Экземпляр AppConfig с загруженными настройками.
         """
-        if not YAML_AVAILABLE:
+        # По умолчанию ищем mqtt_config.yaml в корне проекта
+        path = _DEFAULT_YAML_PATH if yaml_path is None else Path(yaml_path)
+
+        try:
+            import yaml
+        except ImportError:
             logging.warning(
                 "PyYAML не установлен. Используется только конфигурация из .env"
             )
-            return cls()
+            return cls.with_env_proxies()
 
-        if yaml_path is None:
-            # Ищем mqtt_config.yaml в корне проекта
-            yaml_path = Path("mqtt_config.yaml")
-        else:
-            yaml_path = Path(yaml_path)
+        # C-загрузчик на libyaml, если PyYAML собран с ним; иначе чистый Python
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
         # Создаем базовую конфигурацию из .env (для обратной совместимости)
-        config = cls()
+        config = cls.with_env_proxies()
 
+        # Читаем файл без предварительной проверки exists() - лишний stat.
         # Если YAML файл не существует, возвращаем конфигурацию из .env
-        if not yaml_path.exists():
+        try:
+            raw_yaml = path.read_bytes()
+        except FileNotFoundError:
             logging.info(
-                f"YAML файл {yaml_path} не найден. Используется конфигурация из .env"
+                f"YAML файл {path} не найден. Используется конфигурация из .env"
             )
             return config
 
         try:
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                yaml_data = yaml.safe_load(f)
+            # Отдаем загрузчику байты: декодирование UTF-8 выполняет libyaml
+            yaml_data = yaml.load(raw_yaml, Loader=loader)
 
             if not yaml_data:
                 logging.warning(
-                    f"YAML файл {yaml_path} пуст. Используется конфигурация из .env"
+                    f"YAML файл {path} пуст. Используется конфигурация из .env"
                 )
                 return config
 
+            # Поля, заданные в окружении (один проход по os.environ)
+            env_overrides = _env_override_keys("MQTT_SOURCE_", "MESSAGE_PROCESSING_")
+
             # Загружаем MQTT source из YAML
             if "mqtt_source" in yaml_data:
                 mqtt_source_data = yaml_data["mqtt_source"]
                 # Обновляем конфигурацию, используя значения из YAML
                 # Переменные окружения имеют приоритет (уже загружены в config)
-                for key, value in mqtt_source_data.items():
-                    if hasattr(config.mqtt_source, key) and not os.getenv(
-                        f"MQTT_SOURCE_{key.upper()}"
-                    ):
-                        setattr(config.mqtt_source, key, value)
+                mqtt_source = config.mqtt_source.model_copy(
+                    update=_yaml_overrides(
+                        MQTTBrokerConfig,
+                        mqtt_source_data,
+                        env_overrides["MQTT_SOURCE_"],
+                    )
+                )
+                config = config.model_copy(update={"mqtt_source": mqtt_source})
                 logging.info("Загружена конфигурация MQTT source из YAML")
 
             # Загружаем MQTT proxy targets из YAML
             if "mqtt_proxy_targets" in yaml_data:
                 proxy_targets_data = yaml_data["mqtt_proxy_targets"]
                 if isinstance(proxy_targets_data, list):
-                    proxy_targets = []
-                    for target_data in proxy_targets_data:
-                        try:
-                            # Создаем конфигурацию прокси-цели
-                            target_config = MQTTProxyTargetConfig(**target_data)
-                            if target_config.enabled:
-                                proxy_targets.append(target_config)
-                        except Exception as e:
-                            logging.warning(
-                                f"Ошибка при загрузке прокси-цели из YAML: {e}"
-                            )
-                            continue
+                    proxy_targets = [
+                        target
+                        for target in _validate_proxy_targets(proxy_targets_data)
+                        if target.enabled
+                    ]
 
                     if proxy_targets:
-                        config.mqtt_proxy_targets = proxy_targets
+                        config = config.model_copy(
+                            update={"mqtt_proxy_targets": proxy_targets}
+                        )
                         logging.info(
                             f"Загружено {len(proxy_targets)} прокси-целей из YAML"
                         )
@@ -413,54 +647,38 @@ class AppConfig(BaseSettings):
                 message_processing_data = yaml_data["message_processing"]
                 # Обновляем конфигурацию, используя значения из YAML
                 # Переменные окружения имеют приоритет (уже загружены в config)
-                for key, value in message_processing_data.items():
-                    if hasattr(config.message_processing, key) and not os.getenv(
-                        f"MESSAGE_PROCESSING_{key.upper()}"
-                    ):
-                        setattr(config.message_processing, key, value)
+                message_processing = config.message_processing.model_copy(
+                    update=_yaml_overrides(
+                        MessageProcessingConfig,
+                        message_processing_data,
+                        env_overrides["MESSAGE_PROCESSING_"],
+                    )
+                )
+                config = config.model_copy(
+                    update={"message_processing": message_processing}
+                )
                 logging.info("Загружена конфигурация message_processing из YAML")
 
         except yaml.YAMLError as e:
-            logging.error(f"Ошибка при парсинге YAML файла {yaml_path}: {e}")
+            logging.error(f"Ошибка при парсинге YAML файла {path}: {e}")
             logging.info("Используется конфигурация из .env")
         except Exception as e:
-            logging.error(f"Ошибка при загрузке YAML файла {yaml_path}: {e}")
+            logging.error(f"Ошибка при загрузке YAML файла {path}: {e}")
             logging.info("Используется конфигурация из .env")
 
         return config
 
-    @model_validator(mode="after")
-    def load_proxy_targets(self) -> "AppConfig":
+    @model_validator(mode="before")
+    @classmethod
+    def load_dotenv_file(cls, data: Any) -> Any:
         """
-        Загружает прокси-цели из переменных окружения (для обратной совместимости).
+        Загружает .env до создания вложенных конфигураций.
 
-        Поддерживает загрузку одной цели с префиксом MQTT_PROXY_TARGET_.
-        Если заданы переменные окружения, но список пуст, пытается загрузить конфигурацию.
-        Вызывается только если прокси-цели не были загружены из YAML.
+        Вложенные конфигурации читают os.environ в default_factory, поэтому
+        .env нужно применить раньше валидации полей.
         """
-        # Если уже есть цели (например, из YAML), не перезаписываем
-        if self.mqtt_proxy_targets:
-            return self
-
-        # Проверяем, есть ли переменные с префиксом MQTT_PROXY_TARGET_
-        env_vars = {
-            k: v for k, v in os.environ.items() if k.startswith("MQTT_PROXY_TARGET_")
-        }
-
-        if not env_vars:
-            return self
-
-        # Пробуем загрузить одну цель (базовая поддержка)
-        # Для множественных целей используйте YAML файл
-        try:
-            target_config = MQTTProxyTargetConfig()
-            if target_config.enabled and target_config.host:
-                self.mqtt_proxy_targets = [target_config]
-        except Exception:
-            # Если не удалось загрузить, оставляем пустой список
-            pass
-
-        return self
+        _ensure_dotenv_loaded()
+        return data
 
     def setup_logging(self) -> None:
         """
@@ -469,3 +687,20 @@ class AppConfig(BaseSettings):
         Использует стандартный модуль logging Python.
         """
         setup_logging(level=self.log_level)
+
+
+@lru_cache(maxsize=1)
+def get_config(yaml_path: Optional[str] = None) -> AppConfig:
+    """
+    Возвращает конфигурацию приложения, загружая ее один раз за процесс.
+
+    Повторные вызовы возвращают тот же экземпляр без повторной валидации.
+    Для перезагрузки вызовите clear_config_cache().
+
+    Args:
+        yaml_path: Путь к YAML файлу. По умолчанию 'mqtt_config.yaml'.
+
+    Returns:
+        Экземпляр AppConfig из YAML и переменных окружения
+    """
+    return AppConfig.load_from_yaml(yaml_path)
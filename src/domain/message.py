@@ -4,17 +4,45 @@
 Структурированное представление сообщения, полученного из MQTT.
 """
 
-from datetime import datetime
-from typing import Optional, Dict, Any, TYPE_CHECKING
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
-if TYPE_CHECKING:
-    from src.service.node_cache_service import NodeCacheService
+
+def _utc_now() -> datetime:
+    """Текущее время в UTC с таймзоной (замена устаревшего datetime.utcnow)."""
+    return datetime.now(timezone.utc)
+
+
+# Поля, попадающие в to_dict(): без raw_payload_bytes и имен получателя
+_DICT_FIELDS = frozenset(
+    {
+        "topic",
+        "raw_payload",
+        "received_at",
+        "message_id",
+        "from_node",
+        "from_node_name",
+        "from_node_short",
+        "sender_node",
+        "sender_node_name",
+        "sender_node_short",
+        "to_node",
+        "text",
+        "timestamp",
+        "rssi",
+        "snr",
+    }
+)
 
 
 class MeshtasticMessage(BaseModel):
     """Модель сообщения от Meshtastic с распарсенными полями."""
 
+    # Сообщение не меняется после создания: одни и те же экземпляры
+    # разделяются обработчиками и группами сообщений
+    model_config = ConfigDict(frozen=True)
+
     # Исходный топик MQTT
     topic: str = Field(description="MQTT топик, из которого получено сообщение")
 
@@ -31,7 +59,7 @@ class MeshtasticMessage(BaseModel):
 
     # Время получения
     received_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Время получения сообщения"
+        default_factory=_utc_now, description="Время получения сообщения (UTC)"
     )
 
     # Извлеченные поля из Meshtastic JSON
@@ -76,22 +104,24 @@ class MeshtasticMessage(BaseModel):
         default=None, description="Тип сообщения (text, nodeinfo, position и т.д.)"
     )
 
+    @field_validator("from_node", "sender_node")
+    @classmethod
+    def lowercase_node_id(cls, v: Optional[str]) -> Optional[str]:
+        """
+        Приводит ID ноды к нижнему регистру.
+
+        Нормализуем один раз при создании, чтобы форматтер сравнивал
+        отправителя и ретранслятора без lower() на каждое сообщение.
+        MessageFactory создает сообщения через model_construct с уже
+        нормализованными ID (_normalize_node_id).
+        """
+        return v.lower() if v else v
+
+    @field_serializer("received_at", when_used="json")
+    def serialize_received_at(self, value: datetime) -> str:
+        """Сериализует время получения в ISO формате (со смещением +00:00)."""
+        return value.isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         """Преобразует сообщение в словарь для сериализации."""
-        return {
-            "topic": self.topic,
-            "raw_payload": self.raw_payload,
-            "received_at": self.received_at.isoformat(),
-            "message_id": self.message_id,
-            "from_node": self.from_node,
-            "from_node_name": self.from_node_name,
-            "from_node_short": self.from_node_short,
-            "sender_node": self.sender_node,
-            "sender_node_name": self.sender_node_name,
-            "sender_node_short": self.sender_node_short,
-            "to_node": self.to_node,
-            "text": self.text,
-            "timestamp": self.timestamp,
-            "rssi": self.rssi,
-            "snr": self.snr,
-        }
+        return self.model_dump(mode="json", include=_DICT_FIELDS)
@@ -3,10 +3,12 @@
 """
 
 import logging
-from typing import Optional, TYPE_CHECKING, Any
+from typing import Optional, TYPE_CHECKING, Collection, Dict
 
 from src.handlers.message_handler_chain import MessageHandler, HandlerConfig
 from src.domain.message import MeshtasticMessage
+from src.service.message_processing_strategy import ProcessingMode
+from src.service.topic_routing_service import RoutingMode
 
 if TYPE_CHECKING:
     from src.service.mqtt_proxy_service import MQTTProxyService
@@ -17,6 +19,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Режим из топика -> (режим обработки, отправлять ли также личные сообщения)
+_STRATEGY_MODES = {
+    RoutingMode.PRIVATE: (ProcessingMode.PRIVATE, False),
+    RoutingMode.GROUP: (ProcessingMode.GROUP, False),
+    RoutingMode.PRIVATE_GROUP: (ProcessingMode.GROUP, True),
+    RoutingMode.ALL: (ProcessingMode.ALL, False),
+}
+
 
 class ProxyHandler(MessageHandler):
     """Обработчик проксирования сообщений в другие MQTT брокеры."""
@@ -50,22 +60,16 @@ class ProxyHandler(MessageHandler):
         # Проверяем режим из топика - приватные сообщения не проксируем
         if self.topic_routing_service:
             routing_mode, _ = self.topic_routing_service.get_effective_mode(topic)
-            from src.service.topic_routing_service import RoutingMode
-
             if routing_mode == RoutingMode.PRIVATE:
                 logger.debug(
                     f"Пропущено проксирование приватного сообщения: topic={topic}"
                 )
                 return
 
-        # Создаем минимальный объект сообщения только с исходными данными
-        proxy_message = MeshtasticMessage(
-            topic=topic,
-            raw_payload={},  # Пустой, так как не парсим (для прокси не нужен)
-            raw_payload_bytes=payload,  # Исходные данные в сыром виде
-        )
+        # Сквозное проксирование: исходные bytes уходят как есть, без
+        # разбора payload и без создания MeshtasticMessage
         try:
-            await self.proxy_service.proxy_message(proxy_message)
+            await self.proxy_service.proxy_raw(topic, payload)
             logger.debug(
                 f"Сообщение проксировано: topic={topic}, size={len(payload)} bytes"
             )
@@ -82,7 +86,7 @@ class TelegramHandler(MessageHandler):
         telegram_repo: "TelegramRepository",
         message_service: "MessageService",
         topic_routing_service: "TopicRoutingService",
-        notify_user_ids: Optional[list[int]] = None,
+        notify_user_ids: Optional[Collection[int]] = None,
         config: Optional[HandlerConfig] = None,
     ):
         """
@@ -93,7 +97,7 @@ class TelegramHandler(MessageHandler):
             telegram_repo: Репозиторий Telegram
             message_service: Сервис обработки сообщений
             topic_routing_service: Сервис определения режима из топика
-            notify_user_ids: Список user_id для уведомлений
+            notify_user_ids: Коллекция user_id для уведомлений (предпочтительно frozenset)
             config: Конфигурация обработчика
         """
         super().__init__(config)
@@ -101,8 +105,19 @@ class TelegramHandler(MessageHandler):
         self.telegram_repo = telegram_repo
         self.message_service = message_service
         self.topic_routing_service = topic_routing_service
-        self.notify_user_ids = notify_user_ids
+        # Список разрешенных пользователей статичен (из конфигурации), поэтому
+        # фильтруем получателей один раз, а не на каждое сообщение
+        self.notify_user_ids: Optional[frozenset] = (
+            frozenset(
+                user_id
+                for user_id in notify_user_ids
+                if telegram_repo.is_user_allowed(user_id)
+            )
+            if notify_user_ids
+            else None
+        )
         self.payload_format = getattr(message_service, "payload_format", "json")
+        self._strategy_by_mode = self._build_strategies()
 
     async def _process(self, topic: str, payload: bytes) -> None:
         """
@@ -162,43 +177,45 @@ class TelegramHandler(MessageHandler):
                 exc_info=True,
             )
 
+    def _build_strategies(self) -> Dict[RoutingMode, "MessageProcessingStrategy"]:
+        """
+        Создает по одной стратегии на каждый режим из топика через фабрику.
+
+        Стратегии не хранят состояния сообщений, поэтому создаются один раз
+        при инициализации обработчика, а не на каждое сообщение.
+
+        Returns:
+            Словарь режим из топика -> стратегия обработки
+        """
+        # Локальный импорт: handler_factory импортирует этот модуль
+        from src.handlers.handler_factory import HandlerChainFactory
+
+        # Используем фабрику для создания стратегий (соблюдаем OCP)
+        return {
+            routing_mode: HandlerChainFactory.create_strategy(
+                mode=processing_mode,
+                send_to_users=send_to_users,
+                node_cache_service=self.strategy.node_cache_service,
+                grouping_service=self.strategy.grouping_service,
+                telegram_config=self.strategy.telegram_config,
+                message_formatter=self.strategy.message_formatter,
+            )
+            for routing_mode, (processing_mode, send_to_users) in _STRATEGY_MODES.items()
+        }
+
     def _get_strategy_for_mode(
-        self, routing_mode: Any
+        self, routing_mode: RoutingMode
     ) -> "MessageProcessingStrategy":
         """
-        Получает стратегию обработки для режима из топика через фабрику.
+        Получает стратегию обработки для режима из топика.
 
         Args:
             routing_mode: Режим маршрутизации из топика
 
         Returns:
-            Стратегия обработки сообщений
+            Стратегия обработки сообщений (для неизвестного режима - как для ALL)
         """
-        from src.service.topic_routing_service import RoutingMode as TRoutingMode
-        from src.service.message_processing_strategy import ProcessingMode
-        from src.handlers.handler_factory import HandlerChainFactory
-
-        # Преобразуем RoutingMode в ProcessingMode
-        if routing_mode == TRoutingMode.PRIVATE:
-            processing_mode = ProcessingMode.PRIVATE
-            send_to_users = False
-        elif routing_mode == TRoutingMode.GROUP:
-            processing_mode = ProcessingMode.GROUP
-            send_to_users = False
-        elif routing_mode == TRoutingMode.PRIVATE_GROUP:
-            processing_mode = ProcessingMode.GROUP
-            send_to_users = True
-        else:  # TRoutingMode.ALL
-            processing_mode = ProcessingMode.ALL
-            send_to_users = False
-
-        # Используем фабрику для создания стратегии (соблюдаем OCP)
-        return HandlerChainFactory.create_strategy(
-            mode=processing_mode,
-            send_to_users=send_to_users,
-            node_cache_service=self.strategy.node_cache_service,
-            grouping_service=self.strategy.grouping_service,
-            telegram_config=self.strategy.telegram_config,
-            message_formatter=self.strategy.message_formatter,
-        )
-
+        strategy = self._strategy_by_mode.get(routing_mode)
+        if strategy is None:
+            strategy = self._strategy_by_mode[RoutingMode.ALL]
+        return strategy
@@ -6,7 +6,7 @@ import logging
 from typing import Dict, Any, Optional
 
 from src.handlers.handler_registry import registry, HandlerRegistry
-from src.handlers.message_handler_chain import MessageHandler, HandlerConfig
+from src.handlers.message_handler_chain import HandlerChain, HandlerConfig
 from src.handlers.concrete_handlers import ProxyHandler, TelegramHandler
 from src.service.message_processing_strategy import (
     ProcessingMode,
@@ -79,19 +79,20 @@ class HandlerChainFactory:
         handlers_config: Dict[str, Dict[str, Any]],
         dependencies: Dict[str, Any],
         topic_routing_service: Optional[TopicRoutingService] = None,
-    ) -> MessageHandler:
+    ) -> HandlerChain:
         """
         Создает цепочку обработчиков по конфигурации.
 
         Args:
             handlers_config: Конфигурация обработчиков
-                Формат: {"handler_name": {"enabled": True, "priority": 0, ...}}
+                Формат: {"handler_name": {"enabled": True, "priority": 0,
+                "independent": True, ...}}
             dependencies: Зависимости для обработчиков
                 Формат: {"handler_name": {"param1": value1, ...}}
             topic_routing_service: Сервис определения режима из топика
 
         Returns:
-            Корневой обработчик цепочки
+            Плоская цепочка включенных обработчиков в порядке приоритета
 
         Raises:
             ValueError: Если нет включенных обработчиков
@@ -101,13 +102,13 @@ class HandlerChainFactory:
             registry.register(
                 "proxy",
                 ProxyHandler,
-                HandlerConfig(enabled=True, priority=0),
+                HandlerConfig(enabled=True, priority=0, independent=True),
             )
         if not registry.is_registered("telegram"):
             registry.register(
                 "telegram",
                 TelegramHandler,
-                HandlerConfig(enabled=True, priority=1),
+                HandlerConfig(enabled=True, priority=1, independent=True),
             )
 
         # Создаем обработчики из конфигурации
@@ -128,11 +129,15 @@ class HandlerChainFactory:
                     handler_deps["topic_routing_service"] = topic_routing_service
 
                 # Создаем обработчик
+                default_config = registry.get_default_config(handler_name)
                 handler = registry.create_handler(
                     handler_name,
                     HandlerConfig(
                         enabled=handler_config.get("enabled", True),
                         priority=handler_config.get("priority", 0),
+                        independent=handler_config.get(
+                            "independent", default_config.independent
+                        ),
                     ),
                     **handler_deps,
                 )
@@ -148,15 +153,11 @@ class HandlerChainFactory:
         if not handlers:
             raise ValueError("No enabled handlers found")
 
-        # Связываем обработчики в цепочку
-        root = handlers[0]
-        current = root
-        for handler in handlers[1:]:
-            current = current.set_next(handler)
+        chain = HandlerChain(handlers)
 
         logger.info(
             f"Создана цепочка обработчиков из {len(handlers)} элементов: "
             f"{', '.join([h.__class__.__name__ for h in handlers])}"
         )
-        return root
+        return chain
 
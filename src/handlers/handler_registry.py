@@ -65,6 +65,18 @@ class HandlerRegistry:
         handler_config = config or self._default_configs[name]
         return handler_class(config=handler_config, **kwargs)
 
+    def get_default_config(self, name: str) -> HandlerConfig:
+        """
+        Возвращает конфигурацию обработчика по умолчанию.
+
+        Args:
+            name: Имя обработчика
+
+        Returns:
+            Конфигурация по умолчанию (или пустая, если обработчик не зарегистрирован)
+        """
+        return self._default_configs.get(name) or HandlerConfig()
+
     def list_handlers(self) -> List[str]:
         """
         Возвращает список зарегистрированных обработчиков.
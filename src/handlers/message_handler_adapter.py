@@ -6,7 +6,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from src.repo.mqtt_repository import MQTTMessageHandler
-from src.handlers.message_handler_chain import MessageHandler
+from src.handlers.message_handler_chain import HandlerChain
 
 if TYPE_CHECKING:
     pass
@@ -18,10 +18,10 @@ class MessageHandlerAdapter(MQTTMessageHandler):
     """
     Адаптер для использования новой цепочки обработчиков с существующим интерфейсом.
 
-    Позволяет использовать MessageHandler chain там, где ожидается MQTTMessageHandler.
+    Позволяет использовать HandlerChain там, где ожидается MQTTMessageHandler.
     """
 
-    def __init__(self, handler_chain: MessageHandler):
+    def __init__(self, handler_chain: HandlerChain):
         """
         Создает адаптер.
 
@@ -1,12 +1,13 @@
 """
-Цепочка обработчиков сообщений (Chain of Responsibility Pattern).
+Цепочка обработчиков сообщений: базовый MessageHandler и плоская HandlerChain.
 
 Позволяет легко добавлять новые обработчики без изменения существующего кода.
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,7 @@ class HandlerConfig:
 
     enabled: bool = True
     priority: int = 0  # Порядок выполнения (меньше = раньше)
+    independent: bool = False  # Не зависит от других, можно выполнять параллельно
 
 
 class MessageHandler(ABC):
@@ -31,24 +33,10 @@ class MessageHandler(ABC):
             config: Конфигурация обработчика
         """
         self.config = config or HandlerConfig()
-        self._next_handler: Optional["MessageHandler"] = None
-
-    def set_next(self, handler: "MessageHandler") -> "MessageHandler":
-        """
-        Устанавливает следующий обработчик в цепочке.
-
-        Args:
-            handler: Следующий обработчик
-
-        Returns:
-            Установленный обработчик (для цепочки вызовов)
-        """
-        self._next_handler = handler
-        return handler
 
     async def handle(self, topic: str, payload: bytes) -> None:
         """
-        Обрабатывает сообщение и передает следующему обработчику.
+        Обрабатывает сообщение, если обработчик включен.
 
         Args:
             topic: MQTT топик сообщения
@@ -63,9 +51,6 @@ class MessageHandler(ABC):
                     exc_info=True,
                 )
 
-        if self._next_handler:
-            await self._next_handler.handle(topic, payload)
-
     @abstractmethod
     async def _process(self, topic: str, payload: bytes) -> None:
         """
@@ -77,3 +62,77 @@ class MessageHandler(ABC):
         """
         pass
 
+
+class HandlerChain:
+    """
+    Плоская цепочка обработчиков.
+
+    Список включенных обработчиков фиксируется один раз при создании,
+    поэтому на каждое сообщение не выполняется повторная проверка
+    config.enabled.
+
+    Сначала по очереди выполняются зависимые обработчики, затем
+    независимые (config.independent) - одновременно через asyncio.gather.
+    """
+
+    def __init__(self, handlers: Sequence[MessageHandler]):
+        """
+        Создает цепочку.
+
+        Args:
+            handlers: Обработчики в порядке выполнения (отключенные пропускаются)
+        """
+        self.handlers: Tuple[MessageHandler, ...] = tuple(
+            handler for handler in handlers if handler.config.enabled
+        )
+        self._sequential: Tuple[MessageHandler, ...] = tuple(
+            handler for handler in self.handlers if not handler.config.independent
+        )
+        self._parallel: Tuple[MessageHandler, ...] = tuple(
+            handler for handler in self.handlers if handler.config.independent
+        )
+
+    async def handle(self, topic: str, payload: bytes) -> None:
+        """
+        Передает сообщение всем обработчикам.
+
+        Ошибка одного обработчика логируется и не прерывает остальные.
+
+        Args:
+            topic: MQTT топик сообщения
+            payload: Данные сообщения в байтах
+        """
+        for handler in self._sequential:
+            try:
+                await handler._process(topic, payload)
+            except Exception as e:
+                self._log_error(handler, e)
+
+        if len(self._parallel) == 1:
+            handler = self._parallel[0]
+            try:
+                await handler._process(topic, payload)
+            except Exception as e:
+                self._log_error(handler, e)
+        elif self._parallel:
+            results = await asyncio.gather(
+                *(handler._process(topic, payload) for handler in self._parallel),
+                return_exceptions=True,
+            )
+            for handler, result in zip(self._parallel, results):
+                if isinstance(result, Exception):
+                    self._log_error(handler, result)
+
+    @staticmethod
+    def _log_error(handler: MessageHandler, error: BaseException) -> None:
+        """
+        Логирует ошибку обработчика.
+
+        Args:
+            handler: Обработчик, в котором произошла ошибка
+            error: Исключение
+        """
+        logger.error(
+            f"Ошибка в обработчике {handler.__class__.__name__}: {error}",
+            exc_info=error,
+        )
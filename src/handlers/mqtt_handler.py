@@ -78,8 +78,9 @@ class ProxyMessageHandler(BaseMQTTMessageHandler):
             topic: MQTT топик сообщения
             payload: Данные сообщения в байтах (сырой формат)
         """
-        # Создаем минимальный объект сообщения только с исходными данными
-        proxy_message = MeshtasticMessage(
+        # Создаем минимальный объект сообщения только с исходными данными;
+        # поля заданы явно, поэтому валидация pydantic не нужна
+        proxy_message = MeshtasticMessage.model_construct(
             topic=topic,
             raw_payload={},  # Пустой, так как не парсим (для прокси не нужен)
             raw_payload_bytes=payload,  # Исходные данные в сыром виде
@@ -117,7 +118,16 @@ class MainBrokerMessageHandler(BaseMQTTMessageHandler):
         self.telegram_repo = telegram_repo
         self.message_service = message_service
         self.telegram_config = telegram_config
-        self.notify_user_ids = notify_user_ids
+        # Фильтруем получателей по разрешенным пользователям один раз
+        self.notify_user_ids = (
+            [
+                user_id
+                for user_id in notify_user_ids
+                if telegram_repo.is_user_allowed(user_id)
+            ]
+            if notify_user_ids
+            else None
+        )
         self.payload_format = getattr(message_service, "payload_format", "json")
         self.grouping_service = grouping_service
         self._sent_message_ids: Dict[str, int] = {}  # message_id -> telegram_message_id
@@ -180,20 +190,7 @@ class MainBrokerMessageHandler(BaseMQTTMessageHandler):
                 # Проверяем, есть ли уже telegram_message_id
                 if group.telegram_message_id is None:
                     # Первое сообщение - отправляем новое
-                    received_by_nodes = [
-                        {
-                            "node_id": node.node_id,
-                            "node_name": node.node_name,
-                            "node_short": node.node_short,
-                            "received_at": node.received_at,
-                            "rssi": node.rssi,
-                            "snr": node.snr,
-                            "hops_away": node.hops_away,
-                            "sender_node": node.sender_node,
-                            "sender_node_name": node.sender_node_name,
-                        }
-                        for node in group.get_unique_nodes()
-                    ]
+                    received_by_nodes = group.get_unique_nodes()
 
                     telegram_text = message.format_for_telegram_with_grouping(
                         received_by_nodes=received_by_nodes,
@@ -220,20 +217,7 @@ class MainBrokerMessageHandler(BaseMQTTMessageHandler):
                     message.message_id
                 ):
                     # Обновляем существующее сообщение
-                    received_by_nodes = [
-                        {
-                            "node_id": node.node_id,
-                            "node_name": node.node_name,
-                            "node_short": node.node_short,
-                            "received_at": node.received_at,
-                            "rssi": node.rssi,
-                            "snr": node.snr,
-                            "hops_away": node.hops_away,
-                            "sender_node": node.sender_node,
-                            "sender_node_name": node.sender_node_name,
-                        }
-                        for node in group.get_unique_nodes()
-                    ]
+                    received_by_nodes = group.get_unique_nodes()
 
                     telegram_text = message.format_for_telegram_with_grouping(
                         received_by_nodes=received_by_nodes,
@@ -278,14 +262,13 @@ class MainBrokerMessageHandler(BaseMQTTMessageHandler):
                 node_cache_service=self.message_service.node_cache_service
             )
             for user_id in self.notify_user_ids:
-                if self.telegram_repo.is_user_allowed(user_id):
-                    try:
-                        await self.telegram_repo.send_to_user(user_id, telegram_text)
-                    except Exception as e:
-                        logger.error(
-                            f"Ошибка при отправке пользователю: user_id={user_id}, error={e}",
-                            exc_info=True,
-                        )
+                try:
+                    await self.telegram_repo.send_to_user(user_id, telegram_text)
+                except Exception as e:
+                    logger.error(
+                        f"Ошибка при отправке пользователю: user_id={user_id}, error={e}",
+                        exc_info=True,
+                    )
 
         logger.info(f"Успешно обработано MQTT сообщение: topic={topic}")
 
@@ -222,7 +222,7 @@ class TelegramCommandsHandler:
         # Информация о разрешенных пользователях
         allowed_users = self.telegram_repo.config.allowed_user_ids
         if allowed_users:
-            users_str = ", ".join(str(uid) for uid in allowed_users)
+            users_str = ", ".join(str(uid) for uid in sorted(allowed_users))
             info_parts.append(f"Разрешенные пользователи: {users_str}")
         else:
             info_parts.append("Разрешенные пользователи: все")
@@ -90,6 +90,24 @@ class MQTTConnectionManager:
             self._client = None
             self._connected = False
             raise
+        except BaseException:
+            # Таймаут или отмена (например, wait_for при запуске) посреди
+            # __aenter__: закрываем полуоткрытый клиент, иначе disconnect()
+            # его уже не увидит
+            await self._close_half_open_client()
+            raise
+
+    async def _close_half_open_client(self) -> None:
+        """Закрывает клиент, подключение которого было прервано."""
+        client, self._client = self._client, None
+        self._connected = False
+        if client is None:
+            return
+
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f"Ошибка при закрытии прерванного MQTT подключения: {e}")
 
     async def disconnect(self) -> None:
         """Отключается от MQTT брокера."""
@@ -6,6 +6,7 @@
 
 import logging
 from typing import Optional
+from telebot import asyncio_helper
 from telebot.async_telebot import AsyncTeleBot
 
 from src.config import TelegramConfig
@@ -44,10 +45,28 @@ class TelegramConnectionManager:
             logger.debug("Создан экземпляр Telegram бота")
         return self._bot
 
+    async def connect(self) -> None:
+        """
+        Прогревает подключение к Telegram запросом getMe.
+
+        Проверяет токен и заранее устанавливает DNS/TLS-соединение, чтобы
+        первое уведомление не ждало холодного старта.
+        """
+        me = await self.bot.get_me()
+        logger.info(f"Подключение к Telegram установлено: @{me.username}")
+
     async def close(self) -> None:
-        """Закрывает подключение к Telegram."""
+        """
+        Закрывает подключение к Telegram.
+
+        pyTelegramBotAPI держит одну aiohttp-сессию (пул соединений и
+        SSLContext) на поток - закрываем ее, чтобы не оставлять открытые
+        соединения при остановке.
+        """
         if self._bot:
-            # pyTelegramBotAPI не требует явного закрытия, но можно добавить очистку
+            session = asyncio_helper.session_manager.session
+            if session is not None and not session.closed:
+                await session.close()
             self._bot = None
             logger.debug("Подключение к Telegram закрыто")
 
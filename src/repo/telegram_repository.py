@@ -7,7 +7,7 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 from telebot.async_telebot import AsyncTeleBot
 
 from src.config import TelegramConfig
@@ -88,7 +88,7 @@ class AsyncTelegramRepository(TelegramRepository):
             connection_manager = TelegramConnectionManager(config)
         self.connection_manager = connection_manager
         
-        self._allowed_user_ids: Optional[List[int]] = config.allowed_user_ids
+        self._allowed_user_ids: Optional[frozenset[int]] = config.allowed_user_ids
 
     @property
     def bot(self) -> AsyncTeleBot:
@@ -100,6 +100,14 @@ class AsyncTelegramRepository(TelegramRepository):
         """
         return self.connection_manager.bot
 
+    async def connect(self) -> None:
+        """Подключается к Telegram через менеджер подключения."""
+        await self.connection_manager.connect()
+
+    async def disconnect(self) -> None:
+        """Закрывает подключение к Telegram через менеджер подключения."""
+        await self.connection_manager.close()
+
     async def send_message(
         self,
         chat_id: int,
@@ -14,6 +14,16 @@ from src.service.message_service import _normalize_node_id
 logger = logging.getLogger(__name__)
 
 
+def _to_optional_int(value: Any) -> Optional[int]:
+    """Приводит значение к int, возвращая None для пустых и некорректных значений."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
 class MessageFactory:
     """
     Фабрика для создания доменных моделей MeshtasticMessage.
@@ -116,25 +126,15 @@ class MessageFactory:
                 to_node_name = self.node_cache_service.get_node_name(to_node_str)
                 to_node_short = self.node_cache_service.get_node_shortname(to_node_str)
 
-        rssi = raw_payload.get("rssi")
+        rssi = _to_optional_int(raw_payload.get("rssi"))
         snr = raw_payload.get("snr")
-        if rssi is not None:
-            try:
-                rssi = int(rssi)
-            except (ValueError, TypeError):
-                rssi = None
         if snr is not None:
             try:
                 snr = float(snr)
             except (ValueError, TypeError):
                 snr = None
 
-        hops_away_int = None
-        if hops_away is not None:
-            try:
-                hops_away_int = int(hops_away)
-            except (ValueError, TypeError):
-                hops_away_int = None
+        hops_away_int = _to_optional_int(hops_away)
         if hops_away_int is None and hop_start is not None and hop_limit is not None:
             try:
                 hs = int(hop_start)
@@ -144,7 +144,9 @@ class MessageFactory:
             except (ValueError, TypeError):
                 pass
 
-        message = MeshtasticMessage(
+        # Все поля уже приведены к типам модели выше - валидацию pydantic
+        # на каждом сообщении пропускаем (model_construct)
+        message = MeshtasticMessage.model_construct(
             topic=topic,
             raw_payload=raw_payload,
             raw_payload_bytes=raw_payload_bytes,
@@ -159,8 +161,8 @@ class MessageFactory:
             to_node_name=to_node_name,
             to_node_short=to_node_short,
             hops_away=hops_away_int,
-            text=text,
-            timestamp=timestamp,
+            text=str(text) if text is not None else None,
+            timestamp=_to_optional_int(timestamp),
             rssi=rssi,
             snr=snr,
             message_type=message_type,
@@ -6,7 +6,7 @@
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional, List, Any
 from dataclasses import dataclass, field
 
@@ -16,6 +16,11 @@ from src.domain.message import MeshtasticMessage
 logger = logging.getLogger(__name__)
 
 
+def _utc_now() -> datetime:
+    """Текущее время в UTC с таймзоной (как MeshtasticMessage.received_at)."""
+    return datetime.now(timezone.utc)
+
+
 @dataclass
 class ReceivedByNode:
     """Информация о ноде, которая получила сообщение."""
@@ -23,7 +28,7 @@ class ReceivedByNode:
     node_id: str
     node_name: Optional[str] = None
     node_short: Optional[str] = None
-    received_at: datetime = field(default_factory=datetime.utcnow)
+    received_at: datetime = field(default_factory=_utc_now)
     rssi: Optional[int] = None
     snr: Optional[float] = None
     hops_away: Optional[int] = None
@@ -52,8 +57,8 @@ class MessageGroup:
     telegram_message_id: Optional[int] = None
     original_message: Optional[MeshtasticMessage] = None
     received_by: List[ReceivedByNode] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    last_updated: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utc_now)
+    last_updated: datetime = field(default_factory=_utc_now)
 
     def add_node(self, node: ReceivedByNode) -> bool:
         """
@@ -67,7 +72,7 @@ class MessageGroup:
         """
         if node not in self.received_by:
             self.received_by.append(node)
-            self.last_updated = datetime.utcnow()
+            self.last_updated = _utc_now()
             return True
         return False
 
@@ -221,7 +226,7 @@ class MessageGroupingService:
         if not group:
             return False
 
-        elapsed = datetime.utcnow() - group.last_updated
+        elapsed = _utc_now() - group.last_updated
         return elapsed < self.grouping_timeout
 
     def cleanup_expired_groups(self) -> int:
@@ -231,7 +236,7 @@ class MessageGroupingService:
         Returns:
             Количество удаленных групп
         """
-        now = datetime.utcnow()
+        now = _utc_now()
         expired_ids = [
             msg_id
             for msg_id, group in self._groups.items()
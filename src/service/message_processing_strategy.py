@@ -7,9 +7,10 @@
 - ALL: все пакеты (включая не-текстовые)
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional, List, TYPE_CHECKING, Any
+from typing import Optional, TYPE_CHECKING, Any, Collection
 from enum import Enum
 
 from src.domain.message import MeshtasticMessage
@@ -80,7 +81,7 @@ class MessageProcessingStrategy(ABC):
         telegram_repo: TelegramRepository,
         topic: str,
         tg_id: Optional[int] = None,
-        notify_user_ids: Optional[List[int]] = None,
+        notify_user_ids: Optional[Collection[int]] = None,
     ) -> None:
         """
         Обрабатывает сообщение согласно стратегии.
@@ -90,10 +91,46 @@ class MessageProcessingStrategy(ABC):
             telegram_repo: Репозиторий Telegram
             topic: MQTT топик сообщения
             tg_id: Telegram ID пользователя (если известен)
-            notify_user_ids: Список user_id для уведомлений
+            notify_user_ids: Список user_id для уведомлений (уже отфильтрован
+                по разрешенным пользователям вызывающей стороной)
         """
         pass
 
+    @staticmethod
+    async def _send_to_users(
+        telegram_repo: TelegramRepository,
+        user_ids: Collection[int],
+        text: str,
+        context: str,
+    ) -> None:
+        """
+        Отправляет текст нескольким пользователям одновременно.
+
+        Запросы к Telegram независимы, поэтому выполняются через
+        asyncio.gather; ошибка одного получателя не мешает остальным.
+
+        Args:
+            telegram_repo: Репозиторий Telegram
+            user_ids: Получатели
+            text: Текст сообщения
+            context: Описание для логов (например, "режим GROUP")
+        """
+        user_ids = tuple(user_ids)
+        results = await asyncio.gather(
+            *(telegram_repo.send_to_user(user_id, text) for user_id in user_ids),
+            return_exceptions=True,
+        )
+        for user_id, result in zip(user_ids, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Ошибка при отправке пользователю {user_id}: {result}",
+                    exc_info=result,
+                )
+            else:
+                logger.debug(
+                    f"Отправлено сообщение пользователю {user_id} ({context})"
+                )
+
 
 class PrivateModeStrategy(MessageProcessingStrategy):
     """Конфиденциальный режим: только личные сообщения."""
@@ -108,7 +145,7 @@ class PrivateModeStrategy(MessageProcessingStrategy):
         telegram_repo: TelegramRepository,
         topic: str,
         tg_id: Optional[int] = None,
-        notify_user_ids: Optional[List[int]] = None,
+        notify_user_ids: Optional[Collection[int]] = None,
     ) -> None:
         """
         Отправляет сообщение только в личный чат с пользователем.
@@ -217,7 +254,7 @@ class GroupModeStrategy(MessageProcessingStrategy):
         telegram_repo: TelegramRepository,
         topic: str,
         tg_id: Optional[int] = None,
-        notify_user_ids: Optional[List[int]] = None,
+        notify_user_ids: Optional[Collection[int]] = None,
     ) -> None:
         """
         Отправляет сообщение в групповой чат и опционально пользователям.
@@ -232,6 +269,10 @@ class GroupModeStrategy(MessageProcessingStrategy):
         # Проверяем, является ли сообщение broadcast (to = "Всем")
         # Личные сообщения не публикуем в группу, только в личный чат
         is_broadcast = message.to_node == "Всем" or message.to_node is None
+
+        # Обычный (не группированный) текст форматируется один раз и
+        # переиспользуется для группы и личных чатов
+        plain_text: Optional[str] = None
         
         # Извлекаем ноду-получателя из топика
         receiver_node_id = None
@@ -265,23 +306,7 @@ class GroupModeStrategy(MessageProcessingStrategy):
                 # Проверяем, есть ли уже telegram_message_id
                 if group.telegram_message_id is None:
                     # Первое сообщение - отправляем новое
-                    received_by_nodes = [
-                        {
-                            "node_id": node.node_id,
-                            "node_name": node.node_name,
-                            "node_short": node.node_short,
-                            "received_at": node.received_at,
-                            "rssi": node.rssi,
-                            "snr": node.snr,
-                            "hops_away": node.hops_away,
-                            "sender_node": node.sender_node,
-                            "sender_node_name": node.sender_node_name,
-                            "sender_node_short": node.sender_node_short,
-                            "sender_rssi": node.sender_rssi,
-                            "sender_snr": node.sender_snr,
-                        }
-                        for node in group.get_unique_nodes()
-                    ]
+                    received_by_nodes = group.get_unique_nodes()
 
                     telegram_text = self.message_formatter.format_with_grouping(
                         message,
@@ -308,23 +333,7 @@ class GroupModeStrategy(MessageProcessingStrategy):
                     message_id_str
                 ):
                     # Обновляем существующее сообщение
-                    received_by_nodes = [
-                        {
-                            "node_id": node.node_id,
-                            "node_name": node.node_name,
-                            "node_short": node.node_short,
-                            "received_at": node.received_at,
-                            "rssi": node.rssi,
-                            "snr": node.snr,
-                            "hops_away": node.hops_away,
-                            "sender_node": node.sender_node,
-                            "sender_node_name": node.sender_node_name,
-                            "sender_node_short": node.sender_node_short,
-                            "sender_rssi": node.sender_rssi,
-                            "sender_snr": node.sender_snr,
-                        }
-                        for node in group.get_unique_nodes()
-                    ]
+                    received_by_nodes = group.get_unique_nodes()
 
                     telegram_text = self.message_formatter.format_with_grouping(
                         message,
@@ -350,13 +359,13 @@ class GroupModeStrategy(MessageProcessingStrategy):
             self.grouping_service.cleanup_expired_groups()
         elif is_broadcast:
             # Обычная отправка без группировки (только для broadcast)
-            telegram_text = self.message_formatter.format(
+            plain_text = self.message_formatter.format(
                 message, node_cache_service=self.node_cache_service
             )
 
             # Отправляем в групповой чат
             try:
-                await telegram_repo.send_to_group(telegram_text)
+                await telegram_repo.send_to_group(plain_text)
                 logger.info("Отправлено сообщение в групповой чат (режим GROUP)")
             except Exception as e:
                 logger.error(
@@ -372,12 +381,12 @@ class GroupModeStrategy(MessageProcessingStrategy):
         # Также отправляем broadcast сообщения пользователям, если включено send_to_users
         if tg_id:
             # Личное сообщение или broadcast - отправляем в личный чат
-            telegram_text = self.message_formatter.format(
+            plain_text = plain_text or self.message_formatter.format(
                 message, node_cache_service=self.node_cache_service
             )
             if telegram_repo.is_user_allowed(tg_id):
                 try:
-                    await telegram_repo.send_to_user(tg_id, telegram_text)
+                    await telegram_repo.send_to_user(tg_id, plain_text)
                     logger.debug(
                         f"Отправлено сообщение пользователю {tg_id} (режим GROUP, to={message.to_node})"
                     )
@@ -388,21 +397,12 @@ class GroupModeStrategy(MessageProcessingStrategy):
                     )
         elif self.send_to_users and notify_user_ids:
             # Broadcast сообщения - отправляем всем указанным пользователям
-            telegram_text = self.message_formatter.format(
+            plain_text = plain_text or self.message_formatter.format(
                 message, node_cache_service=self.node_cache_service
             )
-            for user_id in notify_user_ids:
-                if telegram_repo.is_user_allowed(user_id):
-                    try:
-                        await telegram_repo.send_to_user(user_id, telegram_text)
-                        logger.debug(
-                            f"Отправлено сообщение пользователю {user_id} (режим GROUP)"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Ошибка при отправке пользователю {user_id}: {e}",
-                            exc_info=True,
-                        )
+            await self._send_to_users(
+                telegram_repo, notify_user_ids, plain_text, "режим GROUP"
+            )
 
 
 class AllModeStrategy(MessageProcessingStrategy):
@@ -418,7 +418,7 @@ class AllModeStrategy(MessageProcessingStrategy):
         telegram_repo: TelegramRepository,
         topic: str,
         tg_id: Optional[int] = None,
-        notify_user_ids: Optional[List[int]] = None,
+        notify_user_ids: Optional[Collection[int]] = None,
     ) -> None:
         """
         Отправляет сообщения в группу и пользователям.
@@ -466,23 +466,7 @@ class AllModeStrategy(MessageProcessingStrategy):
                     # Проверяем, есть ли уже telegram_message_id
                     if group.telegram_message_id is None:
                         # Первое сообщение - отправляем новое
-                        received_by_nodes = [
-                            {
-                                "node_id": node.node_id,
-                                "node_name": node.node_name,
-                                "node_short": node.node_short,
-                                "received_at": node.received_at,
-                                "rssi": node.rssi,
-                                "snr": node.snr,
-                                "hops_away": node.hops_away,
-                                "sender_node": node.sender_node,
-                                "sender_node_name": node.sender_node_name,
-                                "sender_node_short": node.sender_node_short,
-                                "sender_rssi": node.sender_rssi,
-                                "sender_snr": node.sender_snr,
-                            }
-                            for node in group.get_unique_nodes()
-                        ]
+                        received_by_nodes = group.get_unique_nodes()
 
                         telegram_text = self.message_formatter.format_with_grouping(
                             message,
@@ -509,23 +493,7 @@ class AllModeStrategy(MessageProcessingStrategy):
                         message_id_str
                     ):
                         # Обновляем существующее сообщение
-                        received_by_nodes = [
-                            {
-                                "node_id": node.node_id,
-                                "node_name": node.node_name,
-                                "node_short": node.node_short,
-                                "received_at": node.received_at,
-                                "rssi": node.rssi,
-                                "snr": node.snr,
-                                "hops_away": node.hops_away,
-                                "sender_node": node.sender_node,
-                                "sender_node_name": node.sender_node_name,
-                                "sender_node_short": node.sender_node_short,
-                                "sender_rssi": node.sender_rssi,
-                                "sender_snr": node.sender_snr,
-                            }
-                            for node in group.get_unique_nodes()
-                        ]
+                        received_by_nodes = group.get_unique_nodes()
 
                         telegram_text = self.message_formatter.format_with_grouping(
                             message,
@@ -576,18 +544,12 @@ class AllModeStrategy(MessageProcessingStrategy):
 
         # Отправляем пользователям (и текстовые, и служебные)
         if notify_user_ids:
-            for user_id in notify_user_ids:
-                if telegram_repo.is_user_allowed(user_id):
-                    try:
-                        await telegram_repo.send_to_user(user_id, telegram_text)
-                        logger.debug(
-                            f"Отправлено сообщение типа {message.message_type} пользователю {user_id} (режим ALL)"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Ошибка при отправке пользователю {user_id}: {e}",
-                            exc_info=True,
-                        )
+            await self._send_to_users(
+                telegram_repo,
+                notify_user_ids,
+                telegram_text,
+                f"тип {message.message_type}, режим ALL",
+            )
 
     def _format_non_text_message(self, message: MeshtasticMessage) -> str:
         """
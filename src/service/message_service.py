@@ -17,6 +17,12 @@ try:
 except Exception:  # noqa: BLE001
     PROTOBUF_AVAILABLE = False
 
+try:
+    # orjson разбирает bytes напрямую и заметно быстрее stdlib json
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:
+    _json_loads = json.loads
+
 from src.domain.message import MeshtasticMessage
 
 
@@ -176,8 +182,14 @@ class JsonMessageParser(BaseParser):
         Returns:
             Созданный объект MeshtasticMessage
         """
-        payload_str = payload.decode("utf-8", errors="replace")
-        raw_payload: Dict[str, Any] = json.loads(payload_str)
+        # Разбираем bytes напрямую - без промежуточной строки.
+        # При ошибке (битый UTF-8, невалидный JSON, значения вне диапазона
+        # orjson) повторяем через stdlib json с заменой символов, как раньше:
+        # так поведение и тип исключения не зависят от наличия orjson
+        try:
+            raw_payload: Dict[str, Any] = _json_loads(payload)
+        except ValueError:
+            raw_payload = json.loads(payload.decode("utf-8", errors="replace"))
         # Сохраняем исходные bytes для проксирования
         return self._create_message(raw_payload, topic, raw_payload_bytes=payload)
 
@@ -142,23 +142,57 @@ class MQTTProxyTarget:
         Args:
             message: Сообщение для публикации
         """
-        if not self.config.enabled:
+        # Проверяем до выбора payload, чтобы не сериализовать JSON впустую
+        if not self._can_publish():
             return
 
+        # Преобразуем топик в строку
+        topic = (
+            str(message.topic) if not isinstance(message.topic, str) else message.topic
+        )
+
+        if message.raw_payload_bytes is not None:
+            payload = message.raw_payload_bytes
+        else:
+            # Fallback - сериализуем JSON, если raw bytes нет
+            logger.warning(
+                f"raw_payload_bytes отсутствует, используем JSON: "
+                f"name={self.config.name}, topic={topic}"
+            )
+            payload = json.dumps(message.raw_payload).encode("utf-8")
+
+        await self.publish_raw(topic, payload)
+
+    def _can_publish(self) -> bool:
+        """
+        Проверяет, можно ли публиковать в этот брокер.
+
+        Returns:
+            True, если цель включена и подключена
+        """
+        if not self.config.enabled:
+            return False
+
         if not self._connected:
             logger.warning(
                 f"Попытка публикации в неподключенный брокер: name={self.config.name}"
             )
+            return False
+
+        return True
+
+    async def publish_raw(self, topic: str, payload: bytes) -> None:
+        """
+        Публикует исходный payload в прокси-брокер без разбора сообщения.
+
+        Args:
+            topic: Исходный MQTT топик
+            payload: Данные сообщения в байтах, как получены от ноды
+        """
+        if not self._can_publish():
             return
 
         try:
-            # Преобразуем топик в строку
-            topic = (
-                str(message.topic)
-                if not isinstance(message.topic, str)
-                else message.topic
-            )
-
             # Сохраняем оригинальный топик для логирования
             original_topic = topic
 
@@ -219,20 +253,10 @@ class MQTTProxyTarget:
                 )
 
             # Публикуем исходный payload в сыром виде
-            if message.raw_payload_bytes is not None:
-                payload = message.raw_payload_bytes
-                logger.debug(
-                    f"Публикация raw bytes: name={self.config.name}, "
-                    f"topic={topic}, size={len(payload)} bytes"
-                )
-            else:
-                # Fallback - сериализуем JSON, если raw bytes нет
-                logger.warning(
-                    f"raw_payload_bytes отсутствует, используем JSON: "
-                    f"name={self.config.name}, topic={topic}"
-                )
-                payload = json.dumps(message.raw_payload).encode("utf-8")
-
+            logger.debug(
+                f"Публикация raw bytes: name={self.config.name}, "
+                f"topic={topic}, size={len(payload)} bytes"
+            )
             await self._client.publish(topic, payload, qos=self.config.qos)
 
             logger.debug(
@@ -316,6 +340,32 @@ class MQTTProxyService:
 
         # Публикуем во все брокеры одновременно
         tasks = [target.publish_message(message) for target in self._targets]
+        await self._gather_publish(tasks)
+
+    async def proxy_raw(self, topic: str, payload: bytes) -> None:
+        """
+        Публикует исходный payload во все прокси-брокеры параллельно.
+
+        Используется для сквозного проксирования: сообщение не разбирается
+        и MeshtasticMessage не создается.
+
+        Args:
+            topic: MQTT топик сообщения
+            payload: Данные сообщения в байтах
+        """
+        if not self._targets:
+            return
+
+        tasks = [target.publish_raw(topic, payload) for target in self._targets]
+        await self._gather_publish(tasks)
+
+    async def _gather_publish(self, tasks: List[Any]) -> None:
+        """
+        Выполняет публикации параллельно и логирует ошибки по целям.
+
+        Args:
+            tasks: Корутины публикации, по одной на каждую цель
+        """
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Логируем ошибки
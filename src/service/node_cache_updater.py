@@ -4,6 +4,7 @@
 Отвечает за извлечение информации о нодах из сообщений и обновление кэша.
 """
 
+import json
 import logging
 from typing import Optional, Any, Dict
 
@@ -59,18 +60,19 @@ class NodeCacheUpdater:
         if not isinstance(payload_data, dict):
             return
 
-        # Логируем полную структуру raw_payload для контекста
-        try:
-            import json
-            raw_payload_json = json.dumps(raw_payload, ensure_ascii=False, indent=2, default=str)
-            logger.info(
-                f"📋 Полная структура raw_payload для nodeinfo:\n"
-                f"{'=' * 80}\n"
-                f"{raw_payload_json}\n"
-                f"{'=' * 80}"
-            )
-        except Exception as e:
-            logger.warning(f"Не удалось сериализовать raw_payload в JSON: {e}")
+        # Логируем полную структуру raw_payload для контекста.
+        # Сериализуем только если INFO действительно будет записан.
+        if logger.isEnabledFor(logging.INFO):
+            try:
+                raw_payload_json = json.dumps(raw_payload, ensure_ascii=False, indent=2, default=str)
+                logger.info(
+                    f"📋 Полная структура raw_payload для nodeinfo:\n"
+                    f"{'=' * 80}\n"
+                    f"{raw_payload_json}\n"
+                    f"{'=' * 80}"
+                )
+            except Exception as e:
+                logger.warning(f"Не удалось сериализовать raw_payload в JSON: {e}")
 
         # Пробуем разные варианты имен полей (для JSON и Protobuf)
         # Protobuf использует snake_case (long_name, short_name)
@@ -6,16 +6,118 @@
 
 import html
 import logging
+from bisect import bisect_right
 from datetime import datetime
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Sequence, TYPE_CHECKING
 
 from src.domain.message import MeshtasticMessage
 
 if TYPE_CHECKING:
+    from src.service.message_grouping_service import ReceivedByNode
     from src.service.node_cache_service import NodeCacheService
 
 logger = logging.getLogger(__name__)
 
+# Пороги качества сигнала для bisect_right: индекс в кортеже эмодзи равен
+# числу порогов, не превышающих значение. RSSI целый, поэтому границы
+# включающие: >= -120 красный, >= -100 желтый, >= -79 (т.е. > -80) зеленый
+_RSSI_THRESHOLDS = (-120, -100, -79)
+_RSSI_EMOJI = ("⚫", "🔴", "🟡", "🟢")
+_SNR_THRESHOLDS = (-5, 0, 5, 10)
+_SNR_EMOJI = ("⚫", "🔴", "🟠", "🟡", "🟢")
+
+# Ссылка на точку в Яндекс Картах (координаты подставляются через format)
+_YANDEX_MAP_URL = "https://yandex.ru/maps/?pt={longitude},{latitude}&z=15&l=map"
+
+
+def _rssi_emoji(rssi: Optional[int]) -> str:
+    """Эмодзи качества RSSI (см. TelegramMessageFormatter.get_rssi_quality_emoji)."""
+    if rssi is None:
+        return "⚪"  # Неизвестно
+
+    # Валидация: RSSI должен быть отрицательным числом (или 0 считается некорректным)
+    # Типичный диапазон для LoRa: от -150 до 0 dBm
+    if not -150 <= rssi < 0:
+        return "⚪"  # Некорректное значение
+
+    return _RSSI_EMOJI[bisect_right(_RSSI_THRESHOLDS, rssi)]
+
+
+def _snr_emoji(snr: Optional[float]) -> str:
+    """Эмодзи качества SNR (см. TelegramMessageFormatter.get_snr_quality_emoji)."""
+    if snr is None:
+        return "⚪"  # Неизвестно
+
+    # Валидация: SNR для LoRa обычно в диапазоне от -20 до 30 dB
+    # Значения вне этого диапазона считаются некорректными
+    if not -20 <= snr <= 30:
+        return "⚪"  # Некорректное значение (вне физических пределов)
+
+    return _SNR_EMOJI[bisect_right(_SNR_THRESHOLDS, snr)]
+
+
+@lru_cache(maxsize=4096)
+def _format_minute(minute: int) -> str:
+    """
+    Форматирует минуту Unix-времени как чч:мм дд.мм.гггг.
+
+    Формат не содержит секунд, поэтому результат кэшируется по минуте:
+    одно сообщение, услышанное несколькими нодами, форматируется один раз.
+
+    Args:
+        minute: Unix timestamp, деленный нацело на 60
+
+    Returns:
+        Строка с локальным временем и датой
+    """
+    return datetime.fromtimestamp(minute * 60).strftime("%H:%M %d.%m.%Y")
+
+
+def _location_label(label: str, position: Optional[tuple]) -> str:
+    """
+    Собирает ссылку на местоположение ноды в Яндекс Картах.
+
+    Args:
+        label: Подпись ссылки ("Отправитель" или "Получатель")
+        position: Координаты (latitude, longitude, altitude) или None
+
+    Returns:
+        HTML-ссылка или подпись "Не известно", если координат нет
+    """
+    if not position:
+        return f"📍 {label}: Не известно"
+    latitude, longitude, _altitude = position
+    yandex_map_url = _YANDEX_MAP_URL.format(latitude=latitude, longitude=longitude)
+    return f'📍 <a href="{yandex_map_url}">{label}</a>'
+
+
+def _node_label(
+    name: Optional[str], short: Optional[str], node_id: Optional[str]
+) -> Optional[str]:
+    """
+    Собирает экранированную подпись ноды: longname (shortname), одно из имен или ID.
+
+    Все пользовательские данные экранируются для защиты от XSS.
+
+    Args:
+        name: Длинное имя ноды
+        short: Короткое имя ноды
+        node_id: ID ноды, используется если имен нет
+
+    Returns:
+        Подпись ноды или None, если нет ни имен, ни ID
+    """
+    if name and short:
+        return f"{html.escape(name)} ({html.escape(short)})"
+    if name:
+        return html.escape(name)
+    if short:
+        return html.escape(short)
+    if node_id:
+        return html.escape(node_id)
+    return None
+
 
 class TelegramMessageFormatter:
     """
@@ -50,24 +152,7 @@ class TelegramMessageFormatter:
         Returns:
             Эмодзи, соответствующий качеству RSSI
         """
-        if rssi is None:
-            return "⚪"  # Неизвестно
-
-        # Валидация: RSSI должен быть отрицательным числом (или 0 считается некорректным)
-        # Типичный диапазон для LoRa: от -150 до 0 dBm
-        if rssi >= 0:
-            return "⚪"  # Некорректное значение (положительное или 0)
-        if rssi < -150:
-            return "⚪"  # Некорректное значение (слишком большое отрицательное)
-
-        if rssi > -80:
-            return "🟢"  # Отличный
-        elif rssi >= -100:
-            return "🟡"  # Нормальный
-        elif rssi >= -120:
-            return "🔴"  # Плохой
-        else:
-            return "⚫"  # Очень плохой
+        return _rssi_emoji(rssi)
 
     @staticmethod
     def get_snr_quality_emoji(snr: Optional[float]) -> str:
@@ -87,24 +172,33 @@ class TelegramMessageFormatter:
         Returns:
             Эмодзи, соответствующий качеству SNR
         """
-        if snr is None:
-            return "⚪"  # Неизвестно
-
-        # Валидация: SNR для LoRa обычно в диапазоне от -20 до 30 dB
-        # Значения вне этого диапазона считаются некорректными
-        if snr < -20 or snr > 30:
-            return "⚪"  # Некорректное значение (вне физических пределов)
-
-        if snr >= 10:
-            return "🟢"  # Отличный
-        elif snr >= 5:
-            return "🟡"  # Хороший
-        elif snr >= 0:
-            return "🟠"  # Удовлетворительный
-        elif snr >= -5:
-            return "🔴"  # Плохой
-        else:
-            return "⚫"  # Очень плохой
+        return _snr_emoji(snr)
+
+    @staticmethod
+    def _recipient_label(
+        to_node: str, cache_service: Optional["NodeCacheService"]
+    ) -> str:
+        """
+        Собирает подпись получателя: имя из кэша и ID в скобках, либо только ID.
+
+        Args:
+            to_node: ID получателя или "Всем" для широковещательных сообщений
+            cache_service: Сервис кэша нод (опционально)
+
+        Returns:
+            Экранированная подпись получателя
+        """
+        if to_node == "Всем":
+            return to_node
+
+        escaped_to_node = html.escape(to_node)
+        if cache_service:
+            cached_name = cache_service.get_node_name(to_node) or (
+                cache_service.get_node_shortname(to_node)
+            )
+            if cached_name:
+                return f"{html.escape(cached_name)} ({escaped_to_node})"
+        return escaped_to_node
 
     def format(
         self, message: MeshtasticMessage, node_cache_service: Optional["NodeCacheService"] = None
@@ -124,101 +218,7 @@ class TelegramMessageFormatter:
             Отформатированная строка сообщения.
         """
         cache_service = node_cache_service or self.node_cache_service
-        parts = []
-
-        # Временная метка в формате чч:мм дд.мм.гггг (вверху)
-        if message.timestamp:
-            try:
-                dt = datetime.fromtimestamp(message.timestamp)
-                # Формат: чч:мм дд.мм.гггг (например: 22:30 09.12.2025)
-                parts.append(f"🕐 <b>{dt.strftime('%H:%M %d.%m.%Y')}</b>")
-            except (ValueError, OSError):
-                pass
-
-        # Формируем информацию об отправителе
-        # Экранируем все пользовательские данные для защиты от XSS
-        sender_info = []
-
-        if message.from_node_name and message.from_node_short:
-            # Если есть и longname и shortname: longname (shortname)
-            escaped_longname = html.escape(message.from_node_name)
-            escaped_shortname = html.escape(message.from_node_short)
-            sender_info.append(f"{escaped_longname} ({escaped_shortname})")
-        elif message.from_node_name:
-            # Если есть только longname: longname
-            sender_info.append(html.escape(message.from_node_name))
-        elif message.from_node_short:
-            # Если есть только shortname: shortname (без скобок)
-            sender_info.append(html.escape(message.from_node_short))
-        elif message.from_node:
-            # Иначе: hex ID от from
-            sender_info.append(html.escape(message.from_node))
-
-        if sender_info:
-            # Объединяем информацию об отправителе
-            sender_str = " ".join(sender_info)
-            parts.append(f"\n📡 <b>От:</b> {sender_str}")
-
-        # Формируем информацию о ретрансляторе (sender)
-        # Показываем только если sender отличается от from_node (сообщение было ретранслировано)
-        # Сравниваем нормализованные значения (оба уже должны быть в формате "!hex")
-        sender_normalized = (
-            message.sender_node.lower() if message.sender_node else None
-        )
-        from_normalized = message.from_node.lower() if message.from_node else None
-        if sender_normalized and sender_normalized != from_normalized:
-            # Экранируем все пользовательские данные для защиты от XSS
-            repeater_info = []
-
-            if message.sender_node_name and message.sender_node_short:
-                # Если есть и longname и shortname: longname (shortname)
-                escaped_longname = html.escape(message.sender_node_name)
-                escaped_shortname = html.escape(message.sender_node_short)
-                repeater_info.append(f"{escaped_longname} ({escaped_shortname})")
-            elif message.sender_node_name:
-                # Если есть только longname: longname
-                repeater_info.append(html.escape(message.sender_node_name))
-            elif message.sender_node_short:
-                # Если есть только shortname: shortname (без скобок)
-                repeater_info.append(html.escape(message.sender_node_short))
-            else:
-                # Иначе: hex ID от sender
-                repeater_info.append(html.escape(message.sender_node))
-
-            if repeater_info:
-                # Объединяем информацию о ретрансляторе
-                repeater_str = " ".join(repeater_info)
-                parts.append(f"🔄 <b>Ретранслировал:</b> {repeater_str}")
-
-        # Формируем информацию о получателе
-        if message.to_node:
-            recipient_info = []
-            # Если to_node = "Всем", просто показываем "Всем"
-            if message.to_node == "Всем":
-                recipient_info.append("Всем")
-            else:
-                # Получаем информацию о получателе из кэша, если доступен
-                if cache_service:
-                    cached_to_name = cache_service.get_node_name(message.to_node)
-                    cached_to_short = cache_service.get_node_shortname(
-                        message.to_node
-                    )
-
-                    if cached_to_name:
-                        recipient_info.append(html.escape(cached_to_name))
-                    elif cached_to_short:
-                        recipient_info.append(html.escape(cached_to_short))
-
-                # Добавляем ID получателя
-                escaped_to_node = html.escape(message.to_node)
-                if recipient_info:
-                    recipient_info.append(f"({escaped_to_node})")
-                else:
-                    recipient_info.append(escaped_to_node)
-
-            if recipient_info:
-                recipient_str = " ".join(recipient_info)
-                parts.append(f"📨 <b>Кому:</b> {recipient_str}\n")
+        parts = self._header_parts(message, cache_service)
 
         # Информация о ретрансляции
         if message.hops_away is not None:
@@ -229,82 +229,46 @@ class TelegramMessageFormatter:
 
         # Качество сигнала (RSSI и SNR с отдельными индикаторами)
         # Показываем только валидные значения (игнорируем None, 0, некорректные)
-        signal_parts = []
+        rssi_str = None
         if message.rssi is not None and message.rssi < 0:
-            rssi_emoji = self.get_rssi_quality_emoji(message.rssi)
+            rssi_emoji = _rssi_emoji(message.rssi)
             # Показываем только если эмодзи не "Неизвестно" (некорректные значения)
             if rssi_emoji != "⚪":
-                signal_parts.append(f"{rssi_emoji} RSSI: {message.rssi} dBm")
+                rssi_str = f"{rssi_emoji} RSSI: {message.rssi} dBm"
 
+        snr_str = None
         if message.snr is not None:
-            snr_emoji = self.get_snr_quality_emoji(message.snr)
-            # Показываем только если эмодзи не "Неизвестно" (некорректные значения)
+            snr_emoji = _snr_emoji(message.snr)
             if snr_emoji != "⚪":
-                signal_parts.append(f"{snr_emoji} SNR: {message.snr:.1f} dB")
+                snr_str = f"{snr_emoji} SNR: {message.snr:.1f} dB"
 
-        if signal_parts:
-            parts.append(f"📶 {' | '.join(signal_parts)}")
+        if rssi_str and snr_str:
+            parts.append(f"📶 {rssi_str} | {snr_str}")
+        elif rssi_str or snr_str:
+            parts.append(f"📶 {rssi_str or snr_str}")
 
         # Местоположение отправителя и получателя (ссылки на Яндекс Карты)
-        location_parts = []
-
-        # Местоположение отправителя
+        sender_position = None
         if cache_service and message.from_node:
             sender_position = cache_service.get_node_position(message.from_node)
-            if sender_position:
-                latitude, longitude, altitude = sender_position
-                yandex_map_url = (
-                    f"https://yandex.ru/maps/?pt={longitude},{latitude}&z=15&l=map"
-                )
-                location_parts.append(f'📍 <a href="{yandex_map_url}">Отправитель</a>')
-            else:
-                location_parts.append("📍 Отправитель: Не известно")
-        else:
-            location_parts.append("📍 Отправитель: Не известно")
+        location_str = _location_label("Отправитель", sender_position)
 
         # Местоположение получателя (только если получатель не "Всем")
         if message.to_node and message.to_node != "Всем":
+            recipient_position = None
             if cache_service:
                 recipient_position = cache_service.get_node_position(message.to_node)
-                if recipient_position:
-                    latitude, longitude, altitude = recipient_position
-                    yandex_map_url = (
-                        f"https://yandex.ru/maps/?pt={longitude},{latitude}&z=15&l=map"
-                    )
-                    location_parts.append(
-                        f'📍 <a href="{yandex_map_url}">Получатель</a>'
-                    )
-                else:
-                    location_parts.append("📍 Получатель: Не известно")
-            else:
-                location_parts.append("📍 Получатель: Не известно")
+            recipient_location = _location_label("Получатель", recipient_position)
+            location_str = f"{location_str} | {recipient_location}"
 
-        if location_parts:
-            parts.append(" | ".join(location_parts))
+        parts.append(location_str)
 
-        # Текст сообщения в цитате (может содержать UTF-8 символы) - экранируем
-        # HTML (внизу)
-        if message.text:
-            escaped_text = html.escape(message.text)
-            # Формируем сообщение с цитатой: "💬 Сообщение:\n" + текст в цитате
-            parts.append(
-                f"\n💬 <b>Сообщение:</b>\n<blockquote>{escaped_text}</blockquote>"
-            )
-
-        if not parts:
-            # Если не удалось извлечь структурированные данные, показываем raw
-            parts.append("📨 Новое сообщение Meshtastic")
-            if message.topic:
-                # Экранируем топик для защиты от XSS
-                escaped_topic = html.escape(message.topic)
-                parts.append(f"Топик: {escaped_topic}")
-
-        return "\n".join(parts)
+        return self._join_with_text(parts, message)
 
     def format_with_grouping(
         self,
         message: MeshtasticMessage,
-        received_by_nodes: List[Dict[str, Any]],
+        received_by_nodes: Sequence["ReceivedByNode"],
         show_receive_time: bool = False,
         node_cache_service: Optional["NodeCacheService"] = None,
     ) -> str:
@@ -313,9 +277,7 @@ class TelegramMessageFormatter:
 
         Args:
             message: Сообщение Meshtastic для форматирования
-            received_by_nodes: Список словарей с информацией о нодах-получателях
-                Каждый словарь должен содержать: node_id, node_name, node_short,
-                received_at, rssi, snr, hops_away, sender_node, sender_node_name
+            received_by_nodes: Ноды-получатели из группы сообщения
             show_receive_time: Показывать ли время получения каждой нодой
             node_cache_service: Сервис кэша нод (если не передан в конструкторе)
 
@@ -323,80 +285,7 @@ class TelegramMessageFormatter:
             Отформатированная строка сообщения с информацией о нодах-получателях.
         """
         cache_service = node_cache_service or self.node_cache_service
-        parts = []
-
-        # Временная метка в формате чч:мм дд.мм.гггг (вверху)
-        if message.timestamp:
-            try:
-                dt = datetime.fromtimestamp(message.timestamp)
-                parts.append(f"🕐 <b>{dt.strftime('%H:%M %d.%m.%Y')}</b>")
-            except (ValueError, OSError):
-                pass
-
-        # Формируем информацию об отправителе
-        sender_info = []
-        if message.from_node_name and message.from_node_short:
-            escaped_longname = html.escape(message.from_node_name)
-            escaped_shortname = html.escape(message.from_node_short)
-            sender_info.append(f"{escaped_longname} ({escaped_shortname})")
-        elif message.from_node_name:
-            sender_info.append(html.escape(message.from_node_name))
-        elif message.from_node_short:
-            sender_info.append(html.escape(message.from_node_short))
-        elif message.from_node:
-            sender_info.append(html.escape(message.from_node))
-
-        if sender_info:
-            sender_str = " ".join(sender_info)
-            parts.append(f"\n📡 <b>От:</b> {sender_str}")
-
-        # Формируем информацию о ретрансляторе (sender)
-        sender_normalized = (
-            message.sender_node.lower() if message.sender_node else None
-        )
-        from_normalized = message.from_node.lower() if message.from_node else None
-        if sender_normalized and sender_normalized != from_normalized:
-            repeater_info = []
-            if message.sender_node_name and message.sender_node_short:
-                escaped_longname = html.escape(message.sender_node_name)
-                escaped_shortname = html.escape(message.sender_node_short)
-                repeater_info.append(f"{escaped_longname} ({escaped_shortname})")
-            elif message.sender_node_name:
-                repeater_info.append(html.escape(message.sender_node_name))
-            elif message.sender_node_short:
-                repeater_info.append(html.escape(message.sender_node_short))
-            else:
-                repeater_info.append(html.escape(message.sender_node))
-
-            if repeater_info:
-                repeater_str = " ".join(repeater_info)
-                parts.append(f"🔄 <b>Ретранслировал:</b> {repeater_str}")
-
-        # Формируем информацию о получателе
-        if message.to_node:
-            recipient_info = []
-            if message.to_node == "Всем":
-                recipient_info.append("Всем")
-            else:
-                if cache_service:
-                    cached_to_name = cache_service.get_node_name(message.to_node)
-                    cached_to_short = cache_service.get_node_shortname(
-                        message.to_node
-                    )
-                    if cached_to_name:
-                        recipient_info.append(html.escape(cached_to_name))
-                    elif cached_to_short:
-                        recipient_info.append(html.escape(cached_to_short))
-
-                escaped_to_node = html.escape(message.to_node)
-                if recipient_info:
-                    recipient_info.append(f"({escaped_to_node})")
-                else:
-                    recipient_info.append(escaped_to_node)
-
-            if recipient_info:
-                recipient_str = " ".join(recipient_info)
-                parts.append(f"📨 <b>Кому:</b> {recipient_str}\n")
+        parts = self._header_parts(message, cache_service)
 
         # Добавляем информацию о нодах-получателях с деревом маршрутизации
         if received_by_nodes:
@@ -413,23 +302,17 @@ class TelegramMessageFormatter:
                 node_parts.append("  • ")
 
                 # Имя ноды-получателя
-                node_name = node_info.get("node_name")
-                node_short = node_info.get("node_short")
-                node_id = node_info.get("node_id", "")
-
-                if node_name and node_short:
-                    escaped_name = html.escape(node_name)
-                    escaped_short = html.escape(node_short)
-                    node_parts.append(f"{escaped_name} ({escaped_short})")
-                elif node_name:
-                    node_parts.append(html.escape(node_name))
-                elif node_short:
-                    node_parts.append(html.escape(node_short))
-                else:
-                    node_parts.append(html.escape(node_id))
+                node_parts.append(
+                    _node_label(
+                        node_info.node_name,
+                        node_info.node_short,
+                        node_info.node_id,
+                    )
+                    or ""
+                )
 
                 # Количество хопов
-                hops_away = node_info.get("hops_away")
+                hops_away = node_info.hops_away
                 if hops_away is not None:
                     node_parts.append(f" 🔄 Хопов: {hops_away}")
                 else:
@@ -437,89 +320,36 @@ class TelegramMessageFormatter:
 
                 # Время получения (если включено)
                 if show_receive_time:
-                    received_at = node_info.get("received_at")
+                    received_at = node_info.received_at
                     if received_at:
-                        if isinstance(received_at, datetime):
-                            time_str = received_at.strftime("%H:%M:%S")
-                        elif isinstance(received_at, str):
-                            try:
-                                dt = datetime.fromisoformat(received_at.replace("Z", "+00:00"))
-                                time_str = dt.strftime("%H:%M:%S")
-                            except (ValueError, AttributeError):
-                                time_str = str(received_at)
-                        else:
-                            time_str = str(received_at)
-                        node_parts.append(f" ({time_str})")
-
-                # Информация о sender_node (от кого получено)
-                sender_node = node_info.get("sender_node")
-                sender_node_name = node_info.get("sender_node_name")
-                sender_node_short = node_info.get("sender_node_short")
-                sender_rssi = node_info.get("sender_rssi")
-                sender_snr = node_info.get("sender_snr")
-
-                # Определяем, от кого получено сообщение
-                # Если sender_node отсутствует или равен from_node - прямая доставка
+                        node_parts.append(f" ({received_at.strftime('%H:%M:%S')})")
+
+                # От кого получено: если sender_node отсутствует или равен
+                # from_node - прямая доставка от отправителя
+                sender_node = node_info.sender_node
                 if not sender_node or sender_node == message.from_node:
-                    # Прямая доставка от отправителя
-                    sender_display_name = None
-                    if message.from_node_name and message.from_node_short:
-                        sender_display_name = f"{html.escape(message.from_node_name)} ({html.escape(message.from_node_short)})"
-                    elif message.from_node_name:
-                        sender_display_name = html.escape(message.from_node_name)
-                    elif message.from_node_short:
-                        sender_display_name = html.escape(message.from_node_short)
-                    elif message.from_node:
-                        sender_display_name = html.escape(message.from_node)
-                    else:
-                        sender_display_name = "Отправитель"
-                    
-                    node_parts.append(f"\n     • ⬆️ {sender_display_name}")
-                    
-                    # RSSI/SNR от отправителя (если есть)
-                    signal_parts = []
-                    if sender_rssi is not None and sender_rssi < 0:
-                        rssi_emoji = self.get_rssi_quality_emoji(sender_rssi)
-                        if rssi_emoji != "⚪":
-                            signal_parts.append(f"{rssi_emoji} {sender_rssi} dBm")
-                    
-                    if sender_snr is not None:
-                        snr_emoji = self.get_snr_quality_emoji(sender_snr)
-                        if snr_emoji != "⚪":
-                            signal_parts.append(f"{snr_emoji} SNR: {sender_snr:.1f} dB")
-                    
-                    if signal_parts:
-                        node_parts.append(f" {' | '.join(signal_parts)}")
+                    sender_display_name = (
+                        _node_label(
+                            message.from_node_name,
+                            message.from_node_short,
+                            message.from_node,
+                        )
+                        or "Отправитель"
+                    )
                 else:
-                    # Получено от ретранслятора (sender_node)
-                    node_parts.append("\n     • ⬆️ ")
-                    
-                    # Имя sender_node
-                    if sender_node_name and sender_node_short:
-                        escaped_sender_name = html.escape(sender_node_name)
-                        escaped_sender_short = html.escape(sender_node_short)
-                        node_parts.append(f"{escaped_sender_name} ({escaped_sender_short})")
-                    elif sender_node_name:
-                        node_parts.append(html.escape(sender_node_name))
-                    elif sender_node_short:
-                        node_parts.append(html.escape(sender_node_short))
-                    else:
-                        node_parts.append(html.escape(sender_node))
-
-                    # RSSI/SNR от sender_node
-                    signal_parts = []
-                    if sender_rssi is not None and sender_rssi < 0:
-                        rssi_emoji = self.get_rssi_quality_emoji(sender_rssi)
-                        if rssi_emoji != "⚪":
-                            signal_parts.append(f"{rssi_emoji} {sender_rssi} dBm")
-                    
-                    if sender_snr is not None:
-                        snr_emoji = self.get_snr_quality_emoji(sender_snr)
-                        if snr_emoji != "⚪":
-                            signal_parts.append(f"{snr_emoji} SNR: {sender_snr:.1f} dB")
-                    
-                    if signal_parts:
-                        node_parts.append(f" {' | '.join(signal_parts)}")
+                    sender_display_name = _node_label(
+                        node_info.sender_node_name,
+                        node_info.sender_node_short,
+                        sender_node,
+                    )
+                node_parts.append(f"\n     • ⬆️ {sender_display_name}")
+
+                # RSSI/SNR на участке от sender_node (или отправителя)
+                signal_str = self._link_signal_label(
+                    node_info.sender_rssi, node_info.sender_snr
+                )
+                if signal_str:
+                    node_parts.append(f" {signal_str}")
 
                 parts.append("".join(node_parts))
 
@@ -532,8 +362,70 @@ class TelegramMessageFormatter:
                 parts.append(tree_text)
                 parts.append("\n")
 
-        # Текст сообщения
+        return self._join_with_text(parts, message)
+
+    def _header_parts(
+        self,
+        message: MeshtasticMessage,
+        cache_service: Optional["NodeCacheService"],
+    ) -> List[str]:
+        """
+        Собирает общие для обоих форматов строки: время, отправитель,
+        ретранслятор и получатель.
+
+        Args:
+            message: Сообщение Meshtastic
+            cache_service: Сервис кэша нод (опционально)
+
+        Returns:
+            Список строк заголовка сообщения
+        """
+        parts = []
+
+        # Временная метка в формате чч:мм дд.мм.гггг (например: 22:30 09.12.2025)
+        if message.timestamp:
+            try:
+                time_str = _format_minute(int(message.timestamp) // 60)
+                parts.append(f"🕐 <b>{time_str}</b>")
+            except (ValueError, OSError):
+                pass
+
+        sender_str = _node_label(
+            message.from_node_name, message.from_node_short, message.from_node
+        )
+        if sender_str:
+            parts.append(f"\n📡 <b>От:</b> {sender_str}")
+
+        # Ретранслятор показываем только если sender отличается от from_node
+        # (оба ID уже приведены к нижнему регистру при создании сообщения)
+        if message.sender_node and message.sender_node != message.from_node:
+            repeater_str = _node_label(
+                message.sender_node_name, message.sender_node_short, message.sender_node
+            )
+            parts.append(f"🔄 <b>Ретранслировал:</b> {repeater_str}")
+
+        if message.to_node:
+            recipient_str = self._recipient_label(message.to_node, cache_service)
+            parts.append(f"📨 <b>Кому:</b> {recipient_str}\n")
+
+        return parts
+
+    @staticmethod
+    def _join_with_text(parts: List[str], message: MeshtasticMessage) -> str:
+        """
+        Добавляет текст сообщения в цитате (внизу) и склеивает строки.
+
+        Если структурированных данных нет, показывает заглушку с топиком.
+
+        Args:
+            parts: Уже собранные строки сообщения
+            message: Сообщение Meshtastic
+
+        Returns:
+            Итоговый текст сообщения
+        """
         if message.text:
+            # Текст может содержать UTF-8 символы - экранируем HTML
             escaped_text = html.escape(message.text)
             parts.append(
                 f"\n💬 <b>Сообщение:</b>\n<blockquote>{escaped_text}</blockquote>"
@@ -542,15 +434,43 @@ class TelegramMessageFormatter:
         if not parts:
             parts.append("📨 Новое сообщение Meshtastic")
             if message.topic:
-                escaped_topic = html.escape(message.topic)
-                parts.append(f"Топик: {escaped_topic}")
+                # Экранируем топик для защиты от XSS
+                parts.append(f"Топик: {html.escape(message.topic)}")
 
         return "\n".join(parts)
 
+    @staticmethod
+    def _link_signal_label(rssi: Optional[int], snr: Optional[float]) -> Optional[str]:
+        """
+        Собирает RSSI/SNR участка маршрута для списка нод-получателей.
+
+        Args:
+            rssi: RSSI в dBm
+            snr: SNR в dB
+
+        Returns:
+            Строка вида "🟢 -70 dBm | 🟡 SNR: 6.0 dB" или None без валидных значений
+        """
+        rssi_str = None
+        if rssi is not None and rssi < 0:
+            rssi_emoji = _rssi_emoji(rssi)
+            if rssi_emoji != "⚪":
+                rssi_str = f"{rssi_emoji} {rssi} dBm"
+
+        snr_str = None
+        if snr is not None:
+            snr_emoji = _snr_emoji(snr)
+            if snr_emoji != "⚪":
+                snr_str = f"{snr_emoji} SNR: {snr:.1f} dB"
+
+        if rssi_str and snr_str:
+            return f"{rssi_str} | {snr_str}"
+        return rssi_str or snr_str
+
     def _build_routing_tree(
         self,
         from_node: Optional[str],
-        received_by_nodes: List[Dict[str, Any]],
+        received_by_nodes: Sequence["ReceivedByNode"],
         cache_service: Optional["NodeCacheService"],
     ) -> Dict[str, Any]:
         """
@@ -585,10 +505,10 @@ class TelegramMessageFormatter:
         
         # Группируем ноды-получатели по sender_node
         # sender_node - это нода, от которой получили сообщение
-        nodes_by_sender: Dict[str, List[Dict[str, Any]]] = {}
+        nodes_by_sender: Dict[str, List["ReceivedByNode"]] = {}
         for node_info in received_by_nodes:
             # Если sender_node отсутствует или равен from_node, значит получили напрямую
-            sender = node_info.get("sender_node")
+            sender = node_info.sender_node
             if not sender or sender == from_node:
                 sender = from_node
             # Нормализуем sender_node (убеждаемся, что это строка)
@@ -608,15 +528,15 @@ class TelegramMessageFormatter:
                 return
             
             for node_info in nodes_by_sender[parent_id]:
-                node_id = node_info.get("node_id")
+                node_id = node_info.node_id
                 if not node_id or node_id in tree:
                     continue
                 
                 # Добавляем ноду в дерево
                 tree[node_id] = {
                     "node_id": node_id,
-                    "node_name": node_info.get("node_name"),
-                    "node_short": node_info.get("node_short"),
+                    "node_name": node_info.node_name,
+                    "node_short": node_info.node_short,
                     "children": [],
                     "level": level,
                     "parent_id": parent_id,
@@ -635,13 +555,13 @@ class TelegramMessageFormatter:
         # Убеждаемся, что все ноды-получатели включены в дерево
         # (на случай, если они не были добавлены из-за отсутствия sender_node или других причин)
         for node_info in received_by_nodes:
-            node_id = node_info.get("node_id")
+            node_id = node_info.node_id
             if node_id and node_id not in tree:
                 # Добавляем как дочернюю ноду отправителя
                 tree[node_id] = {
                     "node_id": node_id,
-                    "node_name": node_info.get("node_name"),
-                    "node_short": node_info.get("node_short"),
+                    "node_name": node_info.node_name,
+                    "node_short": node_info.node_short,
                     "children": [],
                     "level": 1,
                     "parent_id": from_node,
@@ -681,14 +601,7 @@ class TelegramMessageFormatter:
             node_short = node.get("node_short")
             
             # Формируем имя ноды
-            if node_name and node_short:
-                display_name = f"{html.escape(node_name)} ({html.escape(node_short)})"
-            elif node_name:
-                display_name = html.escape(node_name)
-            elif node_short:
-                display_name = html.escape(node_short)
-            else:
-                display_name = html.escape(node_id)
+            display_name = _node_label(node_name, node_short, node_id) or ""
             
             # Получаем координаты для ссылки
             position = None
@@ -697,8 +610,8 @@ class TelegramMessageFormatter:
             
             if position:
                 latitude, longitude, altitude = position
-                yandex_map_url = (
-                    f"https://yandex.ru/maps/?pt={longitude},{latitude}&z=15&l=map"
+                yandex_map_url = _YANDEX_MAP_URL.format(
+                    latitude=latitude, longitude=longitude
                 )
                 node_link = f'<a href="{yandex_map_url}">{display_name}</a>'
             else:
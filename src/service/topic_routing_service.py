@@ -13,6 +13,10 @@ from typing import Optional, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Предел размера кэша разбора топиков: набор топиков ограничен, но кэш
+# не должен расти бесконечно при мусорных топиках
+_TOPIC_CACHE_MAXSIZE = 4096
+
 
 class RoutingMode(str, Enum):
     """Режимы маршрутизации сообщений."""
@@ -43,6 +47,9 @@ class TopicRoutingService:
         """
         self.default_mode = default_mode
         self._user_modes: Dict[int, RoutingMode] = {}  # tg_id -> mode (для переопределения)
+        # topic -> (режим, tg_id): результат разбора топика не зависит
+        # от переопределений пользователей, поэтому кэшируется навсегда
+        self._topic_cache: Dict[str, Tuple[RoutingMode, Optional[int]]] = {}
 
         # Паттерны топиков (проверяются в порядке приоритета)
         # Более специфичные паттерны должны быть первыми
@@ -73,6 +80,26 @@ class TopicRoutingService:
         """
         Определяет режим обработки и tg_id из топика.
 
+        Args:
+            topic: MQTT топик сообщения
+
+        Returns:
+            Кортеж (режим, tg_id или None)
+        """
+        cached = self._topic_cache.get(topic)
+        if cached is not None:
+            return cached
+
+        result = self._match_topic(topic)
+        if len(self._topic_cache) >= _TOPIC_CACHE_MAXSIZE:
+            self._topic_cache.clear()
+        self._topic_cache[topic] = result
+        return result
+
+    def _match_topic(self, topic: str) -> Tuple[RoutingMode, Optional[int]]:
+        """
+        Сопоставляет топик с паттернами без использования кэша.
+
         Args:
             topic: MQTT топик сообщения
 
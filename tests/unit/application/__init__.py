@@ -0,0 +1 @@
+"""Unit-тесты для слоя приложения."""
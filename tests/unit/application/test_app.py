@@ -0,0 +1,193 @@
+"""
+Unit-тесты для MeshtasticTelegramBotApp.
+"""
+
+import asyncio
+import signal
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.application import app as app_module
+from src.application.app import MeshtasticTelegramBotApp
+from src.config import AppConfig, TelegramConfig
+from src.infrastructure.di_container import DIContainer
+
+
+async def _block_forever(*args) -> None:
+    """Имитирует бесконечную задачу (подписка, polling)."""
+    await asyncio.Event().wait()
+
+
+@pytest.fixture
+def container() -> DIContainer:
+    """DI-контейнер с моками всех сервисов приложения."""
+    container = DIContainer()
+
+    broker = MagicMock()
+    broker.start = AsyncMock()
+    broker.stop = AsyncMock()
+    broker.subscribe = AsyncMock(side_effect=_block_forever)
+
+    proxy = MagicMock()
+    proxy.start = AsyncMock()
+    proxy.stop = AsyncMock()
+
+    telegram_repo = MagicMock()
+    telegram_repo.connect = AsyncMock()
+    telegram_repo.disconnect = AsyncMock()
+
+    container.register_singleton("main_broker_service", broker)
+    container.register_singleton("mqtt_proxy_service", proxy)
+    container.register_singleton("telegram_repository", telegram_repo)
+    for name in (
+        "node_cache_service",
+        "message_service",
+        "message_grouping_service",
+        "topic_routing_service",
+    ):
+        container.register_singleton(name, MagicMock())
+    return container
+
+
+@pytest.fixture
+def app(container) -> MeshtasticTelegramBotApp:
+    """Приложение с замоканными сервисами и polling."""
+    config = AppConfig(telegram=TelegramConfig(bot_token="123:test"))
+    app = MeshtasticTelegramBotApp(config, container=container)
+    app.telegram_commands_handler.start_polling = AsyncMock(
+        side_effect=_block_forever
+    )
+    return app
+
+
+class TestAppShutdown:
+    """Тесты остановки приложения."""
+
+    @pytest.mark.asyncio
+    async def test_signal_triggers_single_shutdown(self, app):
+        """Тест: сигнал останавливает приложение, сервисы закрываются один раз."""
+        run_task = asyncio.create_task(app.run_forever())
+        while app._subscribe_task is None:
+            await asyncio.sleep(0)
+        subscribe_task = app._subscribe_task
+        polling_task = app._telegram_polling_task
+
+        app._on_signal(signal.SIGINT)
+        await asyncio.wait_for(run_task, timeout=1)
+
+        app.main_broker_service.stop.assert_awaited_once()
+        app.proxy_service.stop.assert_awaited_once()
+        app.telegram_repo.disconnect.assert_awaited_once()
+        assert subscribe_task.cancelled()
+        assert polling_task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_handlers_built_on_start(self, app):
+        """Тест: цепочка обработчиков собирается в start(), а не в __init__."""
+        assert app.mqtt_handler is None
+
+        run_task = asyncio.create_task(app.run_forever())
+        while app._subscribe_task is None:
+            await asyncio.sleep(0)
+
+        assert app.mqtt_handler is not None
+        app.main_broker_service.subscribe.assert_called_once_with(app.mqtt_handler)
+
+        await app.stop()
+        await asyncio.wait_for(run_task, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_stop_resets_state_for_restart(self, app):
+        """Тест: после остановки повторный запуск не завершается мгновенно."""
+        run_task = asyncio.create_task(app.run_forever())
+        while app._subscribe_task is None:
+            await asyncio.sleep(0)
+        app._on_signal(signal.SIGINT)
+        await asyncio.wait_for(run_task, timeout=1)
+
+        assert app._shutdown_event is None
+        assert app._subscribe_task is None
+        assert app._telegram_polling_task is None
+
+        restart_task = asyncio.create_task(app.run_forever())
+        while app._subscribe_task is None:
+            await asyncio.sleep(0)
+        assert not restart_task.done()
+
+        await app.stop()
+        await asyncio.wait_for(restart_task, timeout=1)
+
+
+async def _wait_until_running(app, run_task) -> None:
+    """Ждет запуска подписки; падает, если run_forever завершился раньше."""
+    for _ in range(1000):
+        if app._subscribe_task is not None or run_task.done():
+            break
+        await asyncio.sleep(0)
+    assert app._subscribe_task is not None, "приложение не дошло до подписки"
+
+
+class TestAppExternalStop:
+    """Тесты остановки приложения вызовом stop() извне."""
+
+    @pytest.mark.asyncio
+    async def test_tasks_cancelled_before_clients_closed(self, app):
+        """Тест: stop() извне сначала отменяет подписку и polling, затем закрывает клиенты."""
+        run_task = asyncio.create_task(app.run_forever())
+        await _wait_until_running(app, run_task)
+        subscribe_task = app._subscribe_task
+        polling_task = app._telegram_polling_task
+        tasks_done_on_disconnect = []
+
+        async def broker_stop() -> None:
+            tasks_done_on_disconnect.append(
+                subscribe_task.done() and polling_task.done()
+            )
+
+        app.main_broker_service.stop.side_effect = broker_stop
+
+        await app.stop()
+        await asyncio.wait_for(run_task, timeout=1)
+
+        assert tasks_done_on_disconnect == [True]
+
+
+class TestAppStartup:
+    """Тесты запуска приложения."""
+
+    @pytest.mark.asyncio
+    async def test_telegram_warm_up_failure_does_not_block_start(self, app):
+        """Тест: ошибка getMe при запуске не мешает подписке и polling."""
+        app.telegram_repo.connect.side_effect = RuntimeError("Telegram API down")
+
+        run_task = asyncio.create_task(app.run_forever())
+        await _wait_until_running(app, run_task)
+
+        app.main_broker_service.subscribe.assert_called_once_with(app.mqtt_handler)
+        app.telegram_commands_handler.start_polling.assert_called_once()
+
+        await app.stop()
+        await asyncio.wait_for(run_task, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_slow_proxy_start_does_not_abort_startup(self, app, monkeypatch):
+        """Тест: долгий запуск необязательных прокси не прерывает старт по таймауту."""
+        monkeypatch.setattr(app_module, "_STARTUP_CONNECT_TIMEOUT", 0.01)
+
+        async def slow_proxy_start() -> None:
+            await asyncio.sleep(0.05)
+
+        app.proxy_service.start.side_effect = slow_proxy_start
+
+        run_task = asyncio.create_task(app.run_forever())
+        for _ in range(100):
+            if app._subscribe_task is not None or run_task.done():
+                break
+            await asyncio.sleep(0.01)
+
+        assert app._subscribe_task is not None
+        app.proxy_service.start.assert_awaited_once()
+
+        await app.stop()
+        await asyncio.wait_for(run_task, timeout=1)
@@ -0,0 +1,111 @@
+"""
+Unit-тесты для параллельного запуска компонентов (startup).
+"""
+
+import asyncio
+
+import pytest
+
+from src.application.startup import InitializationTask, execute_optimized_startup
+
+
+class TestExecuteOptimizedStartup:
+    """Тесты для execute_optimized_startup."""
+
+    @pytest.mark.asyncio
+    async def test_dependencies_run_after_prerequisites(self):
+        """Тест: зависимая задача запускается после своих зависимостей."""
+        order = []
+
+        def make(name):
+            async def run():
+                order.append(name)
+
+            return run
+
+        tasks = [
+            InitializationTask(name="subscribe", coro_factory=make("subscribe"), dependencies=("broker",)),
+            InitializationTask(name="broker", coro_factory=make("broker")),
+            InitializationTask(name="proxy", coro_factory=make("proxy")),
+        ]
+
+        await execute_optimized_startup(tasks)
+
+        assert order.index("broker") < order.index("subscribe")
+        assert set(order) == {"broker", "proxy", "subscribe"}
+
+    @pytest.mark.asyncio
+    async def test_independent_tasks_run_concurrently(self):
+        """Тест: независимые задачи одного уровня выполняются параллельно."""
+        started = asyncio.Event()
+        both_running = []
+
+        async def first():
+            started.set()
+            await asyncio.sleep(0.01)
+
+        async def second():
+            await asyncio.wait_for(started.wait(), 1)
+            both_running.append(True)
+
+        await execute_optimized_startup(
+            [
+                InitializationTask(name="first", coro_factory=first),
+                InitializationTask(name="second", coro_factory=second),
+            ]
+        )
+
+        assert both_running == [True]
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_next_level(self):
+        """Тест: ошибка задачи пробрасывается, зависимые задачи не запускаются."""
+        dependent_called = []
+
+        async def failing():
+            raise RuntimeError("connect failed")
+
+        async def dependent():
+            dependent_called.append(True)
+
+        with pytest.raises(RuntimeError, match="connect failed"):
+            await execute_optimized_startup(
+                [
+                    InitializationTask(name="broker", coro_factory=failing),
+                    InitializationTask(name="subscribe", coro_factory=dependent, dependencies=("broker",)),
+                ]
+            )
+
+        assert dependent_called == []
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Тест: задача, превысившая таймаут, прерывается."""
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await execute_optimized_startup(
+                [InitializationTask(name="slow", coro_factory=slow, timeout=0.01)]
+            )
+
+    @pytest.mark.parametrize(
+        "tasks",
+        [
+            [InitializationTask(name="a", coro_factory=None, dependencies=("missing",))],
+            [
+                InitializationTask(name="a", coro_factory=None, dependencies=("b",)),
+                InitializationTask(name="b", coro_factory=None, dependencies=("a",)),
+            ],
+            [
+                InitializationTask(name="a", coro_factory=None),
+                InitializationTask(name="a", coro_factory=None),
+            ],
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_invalid_graph_raises_value_error(self, tasks):
+        """Тест: неизвестная зависимость, цикл или дубликат дают ValueError."""
+        with pytest.raises(ValueError):
+            await execute_optimized_startup(tasks)
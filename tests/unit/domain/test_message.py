@@ -4,7 +4,7 @@ Unit-тесты для доменной модели MeshtasticMessage.
 Покрытие: 100%
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 import pytest
@@ -30,6 +30,13 @@ class TestMeshtasticMessage:
         assert message.text is None
         assert isinstance(message.received_at, datetime)
 
+    def test_received_at_is_timezone_aware_utc(self):
+        """Тест: received_at по умолчанию содержит таймзону UTC."""
+        message = MeshtasticMessage(topic="msh/2/json/!12345678", raw_payload={})
+
+        assert message.received_at.tzinfo is timezone.utc
+        assert message.to_dict()["received_at"].endswith("+00:00")
+
     def test_create_full_message(self, sample_text_message_payload: Dict[str, Any]):
         """Тест создания сообщения со всеми полями."""
         message = MeshtasticMessage(
@@ -227,14 +234,33 @@ class TestMeshtasticMessage:
         
         assert isinstance(message.timestamp, expected_type)
 
+    def test_node_ids_lowercased(self):
+        """Тест: ID отправителя и ретранслятора приводятся к нижнему регистру."""
+        message = MeshtasticMessage(
+            topic="msh/2/json/!12345678",
+            raw_payload={},
+            from_node="!ABCDEF12",
+            sender_node="!FfFf0000",
+        )
+
+        assert message.from_node == "!abcdef12"
+        assert message.sender_node == "!ffff0000"
+
+    def test_message_is_immutable(self):
+        """Тест: поля сообщения нельзя изменить после создания."""
+        message = MeshtasticMessage(topic="msh/2/json/!12345678", raw_payload={})
+
+        with pytest.raises(ValidationError):
+            message.text = "changed"
+
     def test_received_at_default_factory(self):
         """Тест автоматического создания received_at при создании сообщения."""
-        before = datetime.utcnow()
+        before = datetime.now(timezone.utc)
         message = MeshtasticMessage(
             topic="msh/2/json/!12345678",
             raw_payload={},
         )
-        after = datetime.utcnow()
+        after = datetime.now(timezone.utc)
         
         assert before <= message.received_at <= after
 
@@ -0,0 +1,2 @@
+"""Unit-тесты для слоя обработчиков."""
+
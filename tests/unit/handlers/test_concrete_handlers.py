@@ -0,0 +1,63 @@
+"""
+Unit-тесты для конкретных обработчиков сообщений.
+"""
+
+from unittest.mock import Mock
+
+from src.handlers.concrete_handlers import TelegramHandler
+from src.service.message_processing_strategy import (
+    AllModeStrategy,
+    GroupModeStrategy,
+    PrivateModeStrategy,
+)
+from src.service.topic_routing_service import RoutingMode, TopicRoutingService
+
+
+class TestTelegramHandler:
+    """Тесты выбора стратегии в TelegramHandler."""
+
+    def _create_handler(self) -> TelegramHandler:
+        """Создает обработчик с групповой стратегией по умолчанию."""
+        return TelegramHandler(
+            strategy=GroupModeStrategy(message_formatter=Mock()),
+            telegram_repo=Mock(),
+            message_service=Mock(),
+            topic_routing_service=TopicRoutingService(),
+        )
+
+    def test_strategies_built_once_per_mode(self):
+        """Тест: для режима всегда возвращается один и тот же экземпляр стратегии."""
+        handler = self._create_handler()
+
+        first = handler._get_strategy_for_mode(RoutingMode.PRIVATE)
+        second = handler._get_strategy_for_mode(RoutingMode.PRIVATE)
+
+        assert isinstance(first, PrivateModeStrategy)
+        assert first is second
+
+    def test_private_group_sends_to_users(self):
+        """Тест: PRIVATE_GROUP использует групповую стратегию с отправкой пользователям."""
+        handler = self._create_handler()
+
+        strategy = handler._get_strategy_for_mode(RoutingMode.PRIVATE_GROUP)
+
+        assert isinstance(strategy, GroupModeStrategy)
+        assert strategy.send_to_users is True
+        assert isinstance(
+            handler._get_strategy_for_mode(RoutingMode.ALL), AllModeStrategy
+        )
+
+    def test_notify_user_ids_filtered_once(self):
+        """Тест: неразрешенные получатели отсекаются при создании обработчика."""
+        telegram_repo = Mock()
+        telegram_repo.is_user_allowed.side_effect = lambda user_id: user_id != 2
+
+        handler = TelegramHandler(
+            strategy=GroupModeStrategy(message_formatter=Mock()),
+            telegram_repo=telegram_repo,
+            message_service=Mock(),
+            topic_routing_service=TopicRoutingService(),
+            notify_user_ids=frozenset({1, 2, 3}),
+        )
+
+        assert handler.notify_user_ids == frozenset({1, 3})
@@ -0,0 +1,105 @@
+"""
+Unit-тесты для цепочки обработчиков сообщений.
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from src.handlers.message_handler_chain import (
+    HandlerChain,
+    HandlerConfig,
+    MessageHandler,
+)
+
+
+class _RecordingHandler(MessageHandler):
+    """Обработчик, записывающий вызовы в общий список."""
+
+    def __init__(
+        self,
+        name: str,
+        calls: List[str],
+        config: HandlerConfig = None,
+        fail: bool = False,
+    ):
+        super().__init__(config)
+        self.name = name
+        self.calls = calls
+        self.fail = fail
+
+    async def _process(self, topic: str, payload: bytes) -> None:
+        self.calls.append(self.name)
+        if self.fail:
+            raise RuntimeError("boom")
+
+
+class TestHandlerChain:
+    """Тесты плоской цепочки обработчиков."""
+
+    def test_disabled_handlers_are_dropped(self):
+        """Тест: отключенные обработчики не попадают в цепочку."""
+        calls: List[str] = []
+        enabled = _RecordingHandler("enabled", calls)
+        disabled = _RecordingHandler(
+            "disabled", calls, config=HandlerConfig(enabled=False)
+        )
+
+        chain = HandlerChain([enabled, disabled])
+
+        assert chain.handlers == (enabled,)
+
+    @pytest.mark.asyncio
+    async def test_error_does_not_stop_next_handler(self):
+        """Тест: ошибка обработчика логируется, следующие все равно вызываются."""
+        calls: List[str] = []
+        chain = HandlerChain(
+            [
+                _RecordingHandler("first", calls, fail=True),
+                _RecordingHandler("second", calls),
+            ]
+        )
+
+        await chain.handle("msh/2/json/!12345678", b"{}")
+
+        assert calls == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_independent_handlers_run_concurrently(self):
+        """Тест: независимые обработчики выполняются одновременно."""
+        released = asyncio.Event()
+        calls: List[str] = []
+
+        class _Waiting(MessageHandler):
+            async def _process(self, topic: str, payload: bytes) -> None:
+                await asyncio.wait_for(released.wait(), timeout=1)
+                calls.append("waiting")
+
+        class _Releasing(MessageHandler):
+            async def _process(self, topic: str, payload: bytes) -> None:
+                released.set()
+                calls.append("releasing")
+
+        config = HandlerConfig(independent=True)
+        chain = HandlerChain([_Waiting(config), _Releasing(config)])
+
+        await chain.handle("msh/2/json/!12345678", b"{}")
+
+        assert calls == ["releasing", "waiting"]
+
+    @pytest.mark.asyncio
+    async def test_independent_handler_error_is_isolated(self):
+        """Тест: ошибка независимого обработчика не мешает остальным."""
+        calls: List[str] = []
+        config = HandlerConfig(independent=True)
+        chain = HandlerChain(
+            [
+                _RecordingHandler("failing", calls, config=config, fail=True),
+                _RecordingHandler("working", calls, config=config),
+            ]
+        )
+
+        await chain.handle("msh/2/json/!12345678", b"{}")
+
+        assert sorted(calls) == ["failing", "working"]
@@ -0,0 +1,38 @@
+"""
+Unit-тесты для MQTTConnectionManager.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.config import MQTTBrokerConfig
+from src.infrastructure.mqtt_connection import MQTTConnectionManager
+
+
+async def _hang(*args) -> None:
+    """Имитирует зависшее подключение к брокеру."""
+    await asyncio.Event().wait()
+
+
+class TestMQTTConnectionManager:
+    """Тесты для класса MQTTConnectionManager."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_during_connect_closes_client(self):
+        """Тест: таймаут посреди __aenter__ закрывает полуоткрытый клиент."""
+        client = MagicMock()
+        client.__aenter__ = AsyncMock(side_effect=_hang)
+        client.__aexit__ = AsyncMock()
+        manager = MQTTConnectionManager(MQTTBrokerConfig())
+
+        with patch(
+            "src.infrastructure.mqtt_connection.MQTTClient", return_value=client
+        ):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(manager.connect(), timeout=0.01)
+
+        client.__aexit__.assert_awaited_once()
+        assert manager.client is None
+        assert not manager.is_connected
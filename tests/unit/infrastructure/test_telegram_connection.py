@@ -0,0 +1,58 @@
+"""
+Unit-тесты для TelegramConnectionManager.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from telebot import asyncio_helper
+
+from src.config import TelegramConfig
+from src.infrastructure.telegram_connection import TelegramConnectionManager
+
+
+@pytest.fixture
+def manager() -> TelegramConnectionManager:
+    """Менеджер подключения с тестовым токеном."""
+    return TelegramConnectionManager(TelegramConfig(bot_token="123:test"))
+
+
+class TestTelegramConnectionManager:
+    """Тесты для класса TelegramConnectionManager."""
+
+    def test_bot_created_once(self, manager):
+        """Тест ленивого создания бота."""
+        assert manager.bot is manager.bot
+
+    @pytest.mark.asyncio
+    async def test_close_closes_shared_session(self, manager, monkeypatch):
+        """Тест закрытия общей aiohttp-сессии при close()."""
+        session = MagicMock(closed=False)
+        session.close = AsyncMock()
+        monkeypatch.setattr(asyncio_helper.session_manager, "session", session)
+        _ = manager.bot
+
+        await manager.close()
+
+        session.close.assert_awaited_once()
+        assert manager._bot is None
+
+    @pytest.mark.asyncio
+    async def test_close_without_session(self, manager, monkeypatch):
+        """Тест close() до первого запроса (сессия еще не создана)."""
+        monkeypatch.setattr(asyncio_helper.session_manager, "session", None)
+        _ = manager.bot
+
+        await manager.close()
+
+        assert manager._bot is None
+
+    @pytest.mark.asyncio
+    async def test_connect_calls_get_me(self, manager):
+        """Тест прогрева подключения через getMe."""
+        manager._bot = MagicMock()
+        manager._bot.get_me = AsyncMock(return_value=MagicMock(username="test_bot"))
+
+        await manager.connect()
+
+        manager._bot.get_me.assert_awaited_once()
@@ -433,4 +433,23 @@ class TestMessageFactory:
         
         assert result.timestamp == 1234567890  # rx_time имеет приоритет
 
+    def test_timestamp_coerced_to_int(self, mock_node_cache_service):
+        """Тест приведения timestamp к int (модель создается без валидации)."""
+        factory = MessageFactory(node_cache_service=mock_node_cache_service)
+        topic = "msh/2/json/!12345678"
+
+        from_str = factory.create_message({"type": "text", "rx_time": "123"}, topic)
+        from_float = factory.create_message({"type": "text", "rx_time": 456.0}, topic)
+        invalid = factory.create_message({"type": "text", "rx_time": "abc"}, topic)
+
+        assert from_str.timestamp == 123
+        assert from_float.timestamp == 456
+        assert invalid.timestamp is None
+
+    def test_received_at_default_applied(self, mock_node_cache_service):
+        """Тест: значение по умолчанию received_at заполняется."""
+        factory = MessageFactory(node_cache_service=mock_node_cache_service)
+
+        result = factory.create_message({"type": "text"}, "msh/2/json/!12345678")
 
+        assert result.received_at is not None
@@ -0,0 +1,40 @@
+"""
+Unit-тесты для MessageGroupingService.
+"""
+
+from datetime import timedelta, timezone
+
+from src.domain.message import MeshtasticMessage
+from src.service.message_grouping_service import (
+    MessageGroup,
+    MessageGroupingService,
+    ReceivedByNode,
+)
+
+
+class TestMessageGroupingTimestamps:
+    """Тесты временных меток групп и нод-получателей."""
+
+    def test_default_timestamps_are_utc_aware(self):
+        """Тест: метки времени по умолчанию содержат таймзону UTC."""
+        group = MessageGroup(message_id="1")
+        node = ReceivedByNode(node_id="!12345678")
+
+        assert group.created_at.tzinfo is timezone.utc
+        assert group.last_updated.tzinfo is timezone.utc
+        assert node.received_at.tzinfo is timezone.utc
+
+    def test_received_at_comparable_with_group_timestamps(self):
+        """Тест: время приема из сообщения сравнимо с метками группы."""
+        service = MessageGroupingService(grouping_timeout_seconds=30)
+        message = MeshtasticMessage(
+            topic="msh/2/json/!12345678", raw_payload={}, message_id="1"
+        )
+
+        assert service.add_received_node("1", message) is True
+
+        group = service.get_group("1")
+        node = group.get_unique_nodes()[0]
+        assert group.last_updated - node.received_at >= timedelta(0)
+        assert service.is_grouping_active("1") is True
+        assert service.cleanup_expired_groups() == 0
@@ -0,0 +1,104 @@
+"""
+Unit-тесты для стратегий обработки сообщений.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.domain.message import MeshtasticMessage
+from src.service.message_processing_strategy import GroupModeStrategy
+
+
+class TestGroupModeStrategy:
+    """Тесты для GroupModeStrategy без группировки сообщений."""
+
+    @pytest.fixture
+    def telegram_repo(self):
+        """Мок репозитория Telegram, разрешающий всех пользователей."""
+        repo = Mock()
+        repo.send_to_group = AsyncMock(return_value=1)
+        repo.send_to_user = AsyncMock()
+        repo.is_user_allowed.return_value = True
+        return repo
+
+    @pytest.fixture
+    def formatter(self):
+        """Мок форматтера сообщений."""
+        formatter = Mock()
+        formatter.format.return_value = "formatted"
+        return formatter
+
+    @pytest.fixture
+    def broadcast_message(self):
+        """Широковещательное текстовое сообщение."""
+        return MeshtasticMessage(
+            topic="msh/2/json/!12345678",
+            raw_payload={"type": "text"},
+            to_node="Всем",
+            text="Hello",
+            message_type="text",
+        )
+
+    @pytest.mark.asyncio
+    async def test_broadcast_formatted_once_for_group_and_users(
+        self, telegram_repo, formatter, broadcast_message
+    ):
+        """Тест: broadcast форматируется один раз для группы и всех пользователей."""
+        strategy = GroupModeStrategy(send_to_users=True, message_formatter=formatter)
+
+        await strategy.process_message(
+            broadcast_message,
+            telegram_repo,
+            "msh/2/json/!12345678",
+            notify_user_ids=frozenset({1, 2}),
+        )
+
+        formatter.format.assert_called_once()
+        telegram_repo.send_to_group.assert_awaited_once_with("formatted")
+        assert telegram_repo.send_to_user.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_direct_message_formatted_for_user_only(
+        self, telegram_repo, formatter
+    ):
+        """Тест: личное сообщение не уходит в группу, но форматируется для tg_id."""
+        strategy = GroupModeStrategy(message_formatter=formatter)
+        message = MeshtasticMessage(
+            topic="msh/2/json/!12345678",
+            raw_payload={"type": "text"},
+            to_node="!87654321",
+            text="Hi",
+            message_type="text",
+        )
+
+        await strategy.process_message(
+            message, telegram_repo, "msh/2/json/!12345678", tg_id=42
+        )
+
+        formatter.format.assert_called_once()
+        telegram_repo.send_to_group.assert_not_awaited()
+        telegram_repo.send_to_user.assert_awaited_once_with(42, "formatted")
+
+    @pytest.mark.asyncio
+    async def test_user_send_error_does_not_block_others(
+        self, telegram_repo, formatter, broadcast_message
+    ):
+        """Тест: ошибка отправки одному пользователю не мешает остальным."""
+
+        async def send_to_user(user_id, text):
+            if user_id == 1:
+                raise RuntimeError("blocked by user")
+
+        telegram_repo.send_to_user.side_effect = send_to_user
+        strategy = GroupModeStrategy(send_to_users=True, message_formatter=formatter)
+
+        await strategy.process_message(
+            broadcast_message,
+            telegram_repo,
+            "msh/2/json/!12345678",
+            notify_user_ids=frozenset({1, 2, 3}),
+        )
+
+        sent_to = {call.args[0] for call in telegram_repo.send_to_user.await_args_list}
+        assert sent_to == {1, 2, 3}
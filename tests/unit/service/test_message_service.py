@@ -505,6 +505,24 @@ class TestJsonMessageParser:
         call_args = mock_message_factory.create_message.call_args
         assert call_args[1]["raw_payload_bytes"] == payload
 
+    def test_parse_invalid_utf8_replaced(
+        self,
+        mock_node_cache_service,
+        mock_message_factory,
+        mock_node_cache_updater,
+    ):
+        """Тест: битый UTF-8 в payload заменяется, а не роняет парсинг."""
+        parser = JsonMessageParser(
+            node_cache_service=mock_node_cache_service,
+            message_factory=mock_message_factory,
+            node_cache_updater=mock_node_cache_updater,
+        )
+
+        parser.parse("msh/2/json/!12345678", b'{"type": "text", "text": "a\xffb"}')
+
+        raw_payload = mock_message_factory.create_message.call_args[1]["raw_payload"]
+        assert raw_payload["text"] == "a�b"
+
 
 class TestProtobufMessageParser:
     """Тесты для класса ProtobufMessageParser."""
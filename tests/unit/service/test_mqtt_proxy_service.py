@@ -0,0 +1,98 @@
+"""
+Unit-тесты для MQTTProxyService и MQTTProxyTarget.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.config import MQTTProxyTargetConfig
+from src.domain.message import MeshtasticMessage
+from src.service.mqtt_proxy_service import MQTTProxyService, MQTTProxyTarget
+
+
+def _connected_target(name: str, topic_prefix: str | None = None) -> MQTTProxyTarget:
+    """Создает прокси-цель с мокнутым подключенным клиентом."""
+    target = MQTTProxyTarget(
+        MQTTProxyTargetConfig(name=name, host=f"{name}.local", topic_prefix=topic_prefix),
+        source_topic="msh/#",
+    )
+    target._client = AsyncMock()
+    target._connected = True
+    return target
+
+
+class TestMQTTProxyTarget:
+    """Тесты публикации в один прокси-брокер."""
+
+    @pytest.mark.asyncio
+    async def test_publish_raw_strips_source_prefix(self):
+        """Тест: префикс подписки удаляется, payload уходит без изменений."""
+        target = _connected_target("first", topic_prefix="mirror")
+
+        await target.publish_raw("msh/2/json/!12345678", b"\x01raw")
+
+        target._client.publish.assert_awaited_once_with(
+            "mirror/2/json/!12345678", b"\x01raw", qos=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_publish_raw_skips_disconnected(self):
+        """Тест: в неподключенный брокер ничего не публикуется."""
+        target = _connected_target("first")
+        target._connected = False
+
+        await target.publish_raw("msh/2/json/!12345678", b"{}")
+
+        target._client.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_publish_message_uses_raw_bytes(self):
+        """Тест: publish_message публикует исходные bytes сообщения."""
+        target = _connected_target("first")
+        message = MeshtasticMessage(
+            topic="msh/2/json/!12345678",
+            raw_payload={"type": "text"},
+            raw_payload_bytes=b'{"type":"text"}',
+        )
+
+        await target.publish_message(message)
+
+        target._client.publish.assert_awaited_once_with(
+            "2/json/!12345678", b'{"type":"text"}', qos=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_publish_message_disconnected_skips_json_fallback(self):
+        """Тест: для неподключенной цели JSON-fallback не сериализуется."""
+        target = _connected_target("first")
+        target._connected = False
+        message = MeshtasticMessage(
+            topic="msh/2/json/!12345678",
+            raw_payload={"type": "text"},
+        )
+
+        with patch("src.service.mqtt_proxy_service.json.dumps") as dumps:
+            await target.publish_message(message)
+
+        dumps.assert_not_called()
+        target._client.publish.assert_not_awaited()
+
+
+class TestMQTTProxyService:
+    """Тесты рассылки по всем прокси-брокерам."""
+
+    @pytest.mark.asyncio
+    async def test_proxy_raw_publishes_to_all_targets(self):
+        """Тест: proxy_raw отправляет payload во все цели, ошибка одной не мешает другим."""
+        service = MQTTProxyService([], source_topic="msh/#")
+        failing = _connected_target("failing")
+        failing._client.publish.side_effect = RuntimeError("boom")
+        working = _connected_target("working")
+        service._targets = [failing, working]
+
+        await service.proxy_raw("msh/2/json/!12345678", b"payload")
+
+        working._client.publish.assert_awaited_once_with(
+            "2/json/!12345678", b"payload", qos=1
+        )
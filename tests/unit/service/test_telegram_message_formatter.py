@@ -10,6 +10,7 @@ from unittest.mock import Mock, MagicMock
 import pytest
 
 from src.domain.message import MeshtasticMessage
+from src.service.message_grouping_service import ReceivedByNode
 from src.service.telegram_message_formatter import TelegramMessageFormatter
 
 
@@ -113,20 +114,20 @@ class TestTelegramMessageFormatter:
         )
         
         received_by_nodes = [
-            {
-                "node_id": "!11111111",
-                "node_name": "Node 1",
-                "node_short": "N1",
-                "received_at": datetime.utcnow(),
-                "rssi": -80,
-            },
-            {
-                "node_id": "!22222222",
-                "node_name": "Node 2",
-                "node_short": "N2",
-                "received_at": datetime.utcnow(),
-                "rssi": -90,
-            },
+            ReceivedByNode(
+                node_id="!11111111",
+                node_name="Node 1",
+                node_short="N1",
+                received_at=datetime.utcnow(),
+                rssi=-80,
+            ),
+            ReceivedByNode(
+                node_id="!22222222",
+                node_name="Node 2",
+                node_short="N2",
+                received_at=datetime.utcnow(),
+                rssi=-90,
+            ),
         ]
         
         result = formatter.format_with_grouping(
@@ -150,11 +151,11 @@ class TestTelegramMessageFormatter:
         
         received_at = datetime(2025, 1, 1, 12, 30, 45)
         received_by_nodes = [
-            {
-                "node_id": "!11111111",
-                "node_name": "Node 1",
-                "received_at": received_at,
-            },
+            ReceivedByNode(
+                node_id="!11111111",
+                node_name="Node 1",
+                received_at=received_at,
+            ),
         ]
         
         result = formatter.format_with_grouping(
@@ -189,11 +190,11 @@ class TestTelegramMessageFormatter:
         )
         
         received_by_nodes = [
-            {
-                "node_id": "!11111111",
-                "node_name": "<script>alert('XSS')</script>",
-                "node_short": "N1",
-            },
+            ReceivedByNode(
+                node_id="!11111111",
+                node_name="<script>alert('XSS')</script>",
+                node_short="N1",
+            ),
         ]
         
         result = formatter.format_with_grouping(message, received_by_nodes=received_by_nodes)
@@ -209,6 +210,9 @@ class TestTelegramMessageFormatter:
             (-110, "🔴"),  # Плохой
             (-120, "🔴"),  # Плохой
             (-130, "⚫"),  # Очень плохой
+            (-150, "⚫"),  # Очень плохой (нижняя граница)
+            (-79, "🟢"),  # Отличный (первое значение выше -80)
+            (-81, "🟡"),  # Нормальный (граница -80 не входит в отличный)
             (None, "⚪"),  # Неизвестно
             (0, "⚪"),  # Некорректное значение (0)
             (50, "⚪"),  # Некорректное значение (положительное)
@@ -235,6 +239,7 @@ class TestTelegramMessageFormatter:
             (None, "⚪"),  # Неизвестно
             (-25.0, "⚪"),  # Некорректное значение (< -20)
             (35.0, "⚪"),  # Некорректное значение (> 30)
+            (float("nan"), "⚪"),  # Некорректное значение (NaN)
         ],
     )
     def test_get_snr_quality_emoji(self, snr, expected_emoji):
@@ -456,6 +461,21 @@ class TestTelegramMessageFormatter:
         assert "Relay Node" in result
         assert "Ретранслировано 2 раз" in result
 
+    def test_format_sender_same_as_from_in_other_case(self, mock_node_cache_service):
+        """Тест: sender, совпадающий с from_node с точностью до регистра, не ретранслятор."""
+        formatter = TelegramMessageFormatter(node_cache_service=mock_node_cache_service)
+
+        message = MeshtasticMessage(
+            topic="msh/2/json/!12345678",
+            raw_payload={"type": "text"},
+            from_node="!ABCDEF12",
+            sender_node="!abcdef12",
+        )
+
+        result = formatter.format(message)
+
+        assert "Ретранслировал" not in result
+
     def test_format_timestamp_formatting(self, mock_node_cache_service):
         """Тест форматирования временной метки."""
         formatter = TelegramMessageFormatter(node_cache_service=mock_node_cache_service)
@@ -498,7 +518,7 @@ class TestTelegramMessageFormatter:
         )
         
         received_by_nodes = [
-            {"node_id": f"!{i:08x}", "node_name": f"Node {i}", "rssi": -80 - i}
+            ReceivedByNode(node_id=f"!{i:08x}", node_name=f"Node {i}", rssi=-80 - i)
             for i in range(5)
         ]
         
@@ -520,13 +540,13 @@ class TestTelegramMessageFormatter:
         )
         
         received_by_nodes = [
-            {
-                "node_id": "!11111111",
-                "node_name": "Node 1",
-                "sender_node": "!12345678",  # Получено от отправителя
-                "sender_rssi": -80,  # RSSI от sender_node
-                "sender_snr": 10.5,  # SNR от sender_node
-            },
+            ReceivedByNode(
+                node_id="!11111111",
+                node_name="Node 1",
+                sender_node="!12345678",  # Получено от отправителя
+                sender_rssi=-80,  # RSSI от sender_node
+                sender_snr=10.5,  # SNR от sender_node
+            ),
         ]
         
         result = formatter.format_with_grouping(message, received_by_nodes=received_by_nodes)
@@ -0,0 +1,47 @@
+"""
+Unit-тесты для TopicRoutingService.
+"""
+
+from unittest.mock import patch
+
+from src.service.topic_routing_service import RoutingMode, TopicRoutingService
+
+
+class TestTopicRoutingService:
+    """Тесты определения режима по топику."""
+
+    def test_detect_private_group_mode(self):
+        """Тест: из топика private/group извлекается режим и tg_id."""
+        service = TopicRoutingService()
+
+        mode, tg_id = service.detect_mode_from_topic(
+            "msh/private/42/group/2/json/!12345678"
+        )
+
+        assert mode == RoutingMode.PRIVATE_GROUP
+        assert tg_id == 42
+
+    def test_detect_mode_is_cached_per_topic(self):
+        """Тест: повторный топик не сопоставляется с паттернами заново."""
+        service = TopicRoutingService()
+        topic = "msh/group/2/json/!12345678"
+
+        with patch.object(
+            service, "_match_topic", wraps=service._match_topic
+        ) as match_topic:
+            first = service.detect_mode_from_topic(topic)
+            second = service.detect_mode_from_topic(topic)
+
+        assert first == second == (RoutingMode.GROUP, None)
+        match_topic.assert_called_once_with(topic)
+
+    def test_user_override_applies_to_cached_topic(self):
+        """Тест: переопределение пользователя учитывается после кэширования топика."""
+        service = TopicRoutingService()
+        topic = "msh/private/42/2/json/!12345678"
+
+        assert service.get_effective_mode(topic) == (RoutingMode.PRIVATE, 42)
+
+        service.set_user_mode(42, RoutingMode.GROUP)
+
+        assert service.get_effective_mode(topic) == (RoutingMode.GROUP, 42)
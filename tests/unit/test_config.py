@@ -0,0 +1,342 @@
+"""
+Unit-тесты для конфигурации приложения.
+"""
+
+import logging
+
+import pytest
+from pydantic import ValidationError
+
+import src.config as config_module
+from src.config import (
+    AppConfig,
+    TelegramConfig,
+    clear_config_cache,
+    get_config,
+    setup_logging,
+)
+
+
+@pytest.fixture(autouse=True)
+def config_env(monkeypatch, tmp_path):
+    """Изолирует окружение: рабочая директория без .env, минимальные переменные."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "123:test")
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+class TestLoadFromYamlReload:
+    """Тесты повторной загрузки AppConfig.load_from_yaml (кэширует только get_config)."""
+
+    def test_yaml_change_picked_up(self, tmp_path):
+        """Тест: изменение YAML файла видно при следующей загрузке."""
+        yaml_file = tmp_path / "mqtt_config.yaml"
+        yaml_file.write_text("mqtt_source:\n  host: first.local\n", encoding="utf-8")
+        first = AppConfig.load_from_yaml(str(yaml_file))
+
+        yaml_file.write_text("mqtt_source:\n  host: second.local.host\n", encoding="utf-8")
+        second = AppConfig.load_from_yaml(str(yaml_file))
+
+        assert second is not first
+        assert second.mqtt_source.host == "second.local.host"
+
+    def test_env_change_picked_up(self, monkeypatch, tmp_path):
+        """Тест: изменение переменных окружения видно при следующей загрузке."""
+        yaml_path = str(tmp_path / "missing.yaml")
+        first = AppConfig.load_from_yaml(yaml_path)
+
+        monkeypatch.setenv("MQTT_SOURCE_HOST", "env.local")
+        second = AppConfig.load_from_yaml(yaml_path)
+
+        assert second is not first
+        assert second.mqtt_source.host == "env.local"
+
+
+class TestFrozenConfig:
+    """Тесты неизменяемости конфигурации."""
+
+    def test_assignment_rejected(self):
+        """Тест: конфигурацию нельзя изменить присваиванием."""
+        config = AppConfig()
+
+        with pytest.raises(ValidationError):
+            config.mqtt_source.host = "other.local"
+
+    def test_yaml_values_applied_via_copy(self, tmp_path):
+        """Тест: значения из YAML применяются без изменения базовых моделей."""
+        yaml_file = tmp_path / "mqtt_config.yaml"
+        yaml_file.write_text(
+            "mqtt_source:\n  port: 1884\n  unknown_key: 1\n"
+            "message_processing:\n  default_mode: all\n",
+            encoding="utf-8",
+        )
+
+        config = AppConfig.load_from_yaml(str(yaml_file))
+
+        assert config.mqtt_source.port == 1884
+        assert config.message_processing.default_mode == "all"
+        assert not hasattr(config.mqtt_source, "unknown_key")
+
+
+class TestYamlProxyTargets:
+    """Тесты загрузки прокси-целей из YAML."""
+
+    def test_invalid_and_disabled_targets_skipped(self, tmp_path):
+        """Тест: некорректные и выключенные цели пропускаются, остальные грузятся."""
+        yaml_file = tmp_path / "mqtt_config.yaml"
+        yaml_file.write_text(
+            "mqtt_proxy_targets:\n"
+            "  - name: first\n"
+            "    host: first.local\n"
+            "  - name: no_host\n"
+            "  - name: off\n"
+            "    host: off.local\n"
+            "    enabled: false\n"
+            "  - name: bad_qos\n"
+            "    host: bad.local\n"
+            "    qos: 5\n"
+            "  - name: second\n"
+            "    host: second.local\n",
+            encoding="utf-8",
+        )
+
+        config = AppConfig.load_from_yaml(str(yaml_file))
+
+        assert [t.name for t in config.mqtt_proxy_targets] == ["first", "second"]
+
+    def test_yaml_targets_ignore_proxy_env(self, monkeypatch, tmp_path):
+        """Тест: переменные MQTT_PROXY_TARGET_* не подмешиваются в цели из YAML."""
+        monkeypatch.setenv("MQTT_PROXY_TARGET_PORT", "9999")
+        yaml_file = tmp_path / "mqtt_config.yaml"
+        yaml_file.write_text(
+            "mqtt_proxy_targets:\n  - name: yaml\n    host: yaml.local\n",
+            encoding="utf-8",
+        )
+
+        config = AppConfig.load_from_yaml(str(yaml_file))
+
+        assert [t.port for t in config.mqtt_proxy_targets] == [1883]
+
+
+class TestLoadFromYamlEnvPriority:
+    """Тесты приоритета переменных окружения над YAML."""
+
+    def test_env_overrides_yaml_value(self, monkeypatch, tmp_path):
+        """Тест: значение из окружения не перезаписывается значением из YAML."""
+        monkeypatch.setenv("MQTT_SOURCE_HOST", "env.local")
+        yaml_file = tmp_path / "mqtt_config.yaml"
+        yaml_file.write_text(
+            "mqtt_source:\n  host: yaml.local\n  port: 1884\n", encoding="utf-8"
+        )
+
+        config = AppConfig.load_from_yaml(str(yaml_file))
+
+        assert config.mqtt_source.host == "env.local"
+        assert config.mqtt_source.port == 1884
+
+    def test_empty_env_value_does_not_override(self, monkeypatch, tmp_path):
+        """Тест: пустая переменная окружения не блокирует значение из YAML."""
+        monkeypatch.setenv("MQTT_SOURCE_TOPIC", "")
+        yaml_file = tmp_path / "mqtt_config.yaml"
+        yaml_file.write_text("mqtt_source:\n  topic: msh/yaml/#\n", encoding="utf-8")
+
+        config = AppConfig.load_from_yaml(str(yaml_file))
+
+        assert config.mqtt_source.topic == "msh/yaml/#"
+
+
+class TestEnvProxyTarget:
+    """Тесты загрузки прокси-цели из переменных окружения."""
+
+    @pytest.fixture
+    def proxy_env(self, monkeypatch):
+        """Переменные одной прокси-цели."""
+        monkeypatch.setenv("MQTT_PROXY_TARGET_NAME", "env-proxy")
+        monkeypatch.setenv("MQTT_PROXY_TARGET_HOST", "proxy.local")
+
+    def test_plain_constructor_skips_env_scan(self, proxy_env):
+        """Тест: обычный конструктор не добавляет прокси-цель из окружения."""
+        assert AppConfig().mqtt_proxy_targets == []
+
+    def test_with_env_proxies(self, proxy_env):
+        """Тест: with_env_proxies добавляет прокси-цель из окружения."""
+        config = AppConfig.with_env_proxies()
+
+        assert [t.host for t in config.mqtt_proxy_targets] == ["proxy.local"]
+
+    def test_env_proxy_reused_until_env_changes(self, proxy_env, monkeypatch):
+        """Тест: прокси-цель из окружения переиспользуется, пока окружение то же."""
+        first = AppConfig.with_env_proxies().mqtt_proxy_targets[0]
+        again = AppConfig.with_env_proxies().mqtt_proxy_targets[0]
+
+        monkeypatch.setenv("MQTT_PROXY_TARGET_HOST", "other.local")
+        changed = AppConfig.with_env_proxies().mqtt_proxy_targets[0]
+
+        assert again is first
+        assert changed.host == "other.local"
+
+    def test_load_from_yaml_uses_env_proxy(self, proxy_env, tmp_path):
+        """Тест: load_from_yaml без YAML берет прокси-цель из окружения."""
+        config = AppConfig.load_from_yaml(str(tmp_path / "missing.yaml"))
+
+        assert [t.name for t in config.mqtt_proxy_targets] == ["env-proxy"]
+
+
+class TestGetConfig:
+    """Тесты фабрики get_config."""
+
+    def test_returns_singleton(self):
+        """Тест: повторный вызов возвращает тот же экземпляр."""
+        assert get_config() is get_config()
+
+    def test_custom_yaml_path(self, tmp_path):
+        """Тест: get_config принимает путь к YAML файлу."""
+        yaml_file = tmp_path / "custom.yaml"
+        yaml_file.write_text("mqtt_source:\n  host: custom.local\n", encoding="utf-8")
+
+        config = get_config(str(yaml_file))
+
+        assert config.mqtt_source.host == "custom.local"
+        assert get_config(str(yaml_file)) is config
+
+    def test_clear_config_cache_reloads(self, monkeypatch):
+        """Тест: после clear_config_cache конфигурация загружается заново."""
+        first = get_config()
+        monkeypatch.setenv("MQTT_SOURCE_HOST", "env.local")
+
+        assert get_config() is first
+
+        clear_config_cache()
+        second = get_config()
+
+        assert second is not first
+        assert second.mqtt_source.host == "env.local"
+
+
+class TestLazyDotenv:
+    """Тесты отложенной загрузки .env."""
+
+    def test_dotenv_loaded_once_before_nested_configs(self, monkeypatch):
+        """Тест: .env загружается один раз и до создания вложенных конфигураций."""
+        calls = []
+
+        def fake_load_dotenv():
+            calls.append(True)
+            monkeypatch.setenv("MQTT_SOURCE_HOST", "dotenv.local")
+
+        monkeypatch.setattr(config_module, "_dotenv_loaded", False)
+        monkeypatch.setattr(config_module, "load_dotenv", fake_load_dotenv)
+
+        first = AppConfig()
+        AppConfig()
+
+        assert first.mqtt_source.host == "dotenv.local"
+        assert len(calls) == 1
+
+
+class TestTelegramConfigParsing:
+    """Тесты парсинга полей TelegramConfig."""
+
+    def test_allowed_user_ids_from_string(self):
+        """Тест: список user_id из строки с пробелами и пустыми элементами."""
+        config = TelegramConfig(bot_token="123:test", allowed_user_ids=" 1, 22 ,,333 ")
+
+        assert config.allowed_user_ids == frozenset({1, 22, 333})
+
+    def test_allowed_user_ids_from_list(self):
+        """Тест: список user_id хранится как frozenset."""
+        config = TelegramConfig(bot_token="123:test", allowed_user_ids=[5, 7, 5])
+
+        assert config.allowed_user_ids == frozenset({5, 7})
+
+    def test_single_allowed_user_id_from_env(self, monkeypatch):
+        """Тест: один user_id в окружении (декодируется как число) не теряется."""
+        monkeypatch.setenv("TELEGRAM_ALLOWED_USER_IDS", "42")
+
+        assert TelegramConfig().allowed_user_ids == frozenset({42})
+
+    @pytest.mark.parametrize("value", ["", "  ", "none", "NULL", "nUlL"])
+    def test_group_ids_nullish_strings(self, value):
+        """Тест: пустые и null-подобные строки превращаются в None."""
+        config = TelegramConfig(
+            bot_token="123:test", group_chat_id=value, group_topic_id=value
+        )
+
+        assert config.group_chat_id is None
+        assert config.group_topic_id is None
+
+    def test_group_chat_id_unhashable_value_is_none(self):
+        """Тест: список (например, из YAML) в group_chat_id дает None, а не TypeError."""
+        config = TelegramConfig(bot_token="123:test", group_chat_id=[1, 2])
+
+        assert config.group_chat_id is None
+
+    def test_group_chat_id_from_string(self):
+        """Тест: числовая строка парсится в int."""
+        config = TelegramConfig(bot_token="123:test", group_chat_id=" -100123 ")
+
+        assert config.group_chat_id == -100123
+
+    @pytest.mark.parametrize("value", ["", " ", "none", "NULL"])
+    def test_allowed_user_ids_nullish_strings(self, value):
+        """Тест: пустые и null-подобные строки означают «все пользователи»."""
+        config = TelegramConfig(bot_token="123:test", allowed_user_ids=value)
+
+        assert config.allowed_user_ids is None
+
+    def test_allowed_user_ids_invalid(self):
+        """Тест: некорректный user_id приводит к ошибке валидации."""
+        with pytest.raises(ValueError):
+            TelegramConfig(bot_token="123:test", allowed_user_ids="1,abc")
+
+    def test_allowed_user_ids_parsed_once_per_string(self):
+        """Тест: одна и та же строка парсится один раз, дальше берется из кэша."""
+        config_module._parse_user_ids.cache_clear()
+
+        first = TelegramConfig(bot_token="123:test", allowed_user_ids="10,20")
+        second = TelegramConfig(bot_token="123:test", allowed_user_ids="10,20")
+
+        cache_info = config_module._parse_user_ids.cache_info()
+        assert (cache_info.misses, cache_info.hits) == (1, 1)
+        assert second.allowed_user_ids == first.allowed_user_ids
+
+
+class TestSetupLogging:
+    """Тесты идемпотентности setup_logging."""
+
+    @pytest.fixture(autouse=True)
+    def restore_root_logger(self, monkeypatch):
+        """Восстанавливает корневой логгер после теста."""
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        monkeypatch.setattr(config_module, "_logging_configured", None)
+        yield
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    def test_repeated_call_keeps_handlers(self):
+        """Тест: повторный вызов с теми же параметрами не пересоздает обработчики."""
+        setup_logging(level="DEBUG")
+        handlers = logging.getLogger().handlers[:]
+
+        setup_logging(level="DEBUG")
+
+        assert logging.getLogger().handlers == handlers
+
+    def test_level_is_case_insensitive(self):
+        """Тест: уровень в нижнем регистре (как в YAML) распознается."""
+        setup_logging(level="debug")
+
+        assert logging.getLogger().level == logging.DEBUG
+
+    def test_level_change_reconfigures(self):
+        """Тест: смена уровня применяется."""
+        setup_logging(level="DEBUG")
+        handlers = logging.getLogger().handlers[:]
+
+        setup_logging(level="WARNING")
+
+        assert logging.getLogger().level == logging.WARNING
+        assert logging.getLogger().handlers == handlers